@@ -3,13 +3,21 @@ from __future__ import annotations
 import argparse
 import asyncio
 import functools
+import os
 import threading
 import queue
-from typing import TYPE_CHECKING, Callable
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable
 
 from . import App, Hub
 from ..component.base import check_hub
 
+try:
+    import uvloop
+    HAVE_UVLOOP = True
+except ModuleNotFoundError:
+    HAVE_UVLOOP = False
+
 if TYPE_CHECKING:
     from ..component.aio import AIOComponent
 
@@ -23,6 +31,12 @@ class AIOHub(Hub):
         self.loop: asyncio.AbstractEventLoop | None = None
         self.tasks: set[asyncio.Task] = set()
         self.pre_loop_queue: queue.SimpleQueue[Callable] = queue.SimpleQueue()
+        # Calls posted from realtime threads. There is a single consumer, and
+        # deque appends and pops are atomic, so producers take no locks. The
+        # eventfd is only written when the consumer is not already woken up
+        self.rt_queue: deque[tuple[Callable, tuple[Any, ...]]] = deque()
+        self.rt_wakeup_pending = False
+        self.rt_wakeup_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
 
     def start(self):
         super().start()
@@ -31,6 +45,11 @@ class AIOHub(Hub):
     def join(self):
         super().join()
         self.thread.join()
+        # All components have stopped with the hub thread, including the Jack
+        # component, which deactivates the JACK client on exit: no producer
+        # can post any more, and the eventfd can be closed
+        self.rt_wakeup_pending = True
+        os.close(self.rt_wakeup_fd)
 
     def _running_in_hub(self) -> bool:
         return threading.current_thread() == self.thread
@@ -43,11 +62,50 @@ class AIOHub(Hub):
         else:
             self.loop.call_soon_threadsafe(functools.partial(f, *args, **kwargs))
 
+    def post_rt(self, f: Callable, *args) -> None:
+        """
+        Call the function with the given arguments in the hub context.
+
+        This is meant to be called from realtime or high rate producer threads
+        like the JACK process callback: it takes no locks, and wakes up the
+        event loop at most once per batch of posted calls
+        """
+        self.rt_queue.append((f, args))
+        if self.rt_wakeup_pending:
+            return
+        self.rt_wakeup_pending = True
+        os.eventfd_write(self.rt_wakeup_fd, 1)
+
+    def _drain_rt_queue(self) -> None:
+        """
+        Run all the calls posted from realtime threads
+        """
+        try:
+            os.eventfd_read(self.rt_wakeup_fd)
+        except BlockingIOError:
+            pass
+        # Clear the flag before draining: a call posted after this point
+        # either gets drained now, or triggers a new wakeup
+        self.rt_wakeup_pending = False
+        rt_queue = self.rt_queue
+        while rt_queue:
+            f, args = rt_queue.popleft()
+            try:
+                f(*args)
+            except Exception:
+                self.logger.exception("%s: uncaught exception", f)
+
     def run(self):
-        asyncio.run(self.aio_main())
+        # If available, use uvloop as a faster drop-in replacement for the
+        # default event loop. Besides scheduling, this also speeds up the unix
+        # socket streams used by subprocess components
+        loop_factory = uvloop.new_event_loop if HAVE_UVLOOP else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(self.aio_main())
 
     async def aio_main(self):
         self.loop = asyncio.get_event_loop()
+        self.loop.add_reader(self.rt_wakeup_fd, self._drain_rt_queue)
 
         try:
             # Execute pending callables in pre_loop_queue
@@ -61,6 +119,7 @@ class AIOHub(Hub):
             for task in done:
                 self.logger.debug("component %r terminated", task.get_name())
 
+        self.loop.remove_reader(self.rt_wakeup_fd)
         self.loop = None
         self.app.remove_hub(self)
 
@@ -25,6 +25,9 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Format of log messages
+LOG_FORMAT = "%(levelname)s %(name)s %(message)s"
+
 C = TypeVar("C", bound=Component)
 
 
@@ -116,7 +119,8 @@ class App(contextlib.ExitStack):
 
         This function is called from the App's thread
         """
-        log.debug("Message: %s → %s: %s", msg.src.name if msg.src else "None", msg.dst, msg)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Message: %s → %s: %s", msg.src.name if msg.src else "None", msg.dst, msg)
         for hub in self.hubs.values():
             hub.receive(msg)
 
@@ -124,7 +128,6 @@ class App(contextlib.ExitStack):
         """
         Set up the logging module for this application
         """
-        FORMAT = "%(levelname)s %(name)s %(message)s"
         if self.args.debug:
             log_level = logging.DEBUG
         elif self.args.verbose:
@@ -133,9 +136,9 @@ class App(contextlib.ExitStack):
             log_level = logging.WARN
 
         if HAVE_COLOREDLOGS:
-            coloredlogs.install(level=log_level, fmt=FORMAT)
+            coloredlogs.install(level=log_level, fmt=LOG_FORMAT)
         else:
-            logging.basicConfig(level=log_level, stream=sys.stderr, format=FORMAT)
+            logging.basicConfig(level=log_level, stream=sys.stderr, format=LOG_FORMAT)
 
     def main_init(self):
         """
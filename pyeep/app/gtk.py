@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import argparse
 import logging
+import os
 import threading
-from typing import Callable
+from collections import deque
+from typing import Any, Callable
 
 from . import App, Hub
+from .app import LOG_FORMAT
 from ..component.base import check_hub
 from ..messages.message import Message
 from ..messages.component import Shutdown
@@ -14,7 +17,7 @@ from ..gtk import Adw, GLib, Gtk
 
 
 class LogView(Gtk.ScrolledWindow):
-    def __init__(self, max_lines: int = 500):
+    def __init__(self, max_lines: int = 500, trim_margin: int = 64):
         super().__init__()
         self.textview = Gtk.TextView()
         self.textview.set_editable(False)
@@ -22,34 +25,89 @@ class LogView(Gtk.ScrolledWindow):
         self.textview.set_monospace(True)
         self.set_child(self.textview)
         self.max_lines = max_lines
+        # Let the buffer grow this many lines past max_lines before trimming,
+        # so that trimming happens once every many appends
+        self.trim_margin = trim_margin
+        # Number of lines in the buffer, tracked here to avoid asking the
+        # buffer to count them on every append
+        self.lines = 0
+        # Mark that stays at the end of the buffer, used to scroll to the end
+        buffer = self.textview.get_buffer()
+        self.end_mark = buffer.create_mark(None, buffer.get_end_iter(), False)
 
     def append(self, text: str):
+        """
+        Append text at the end of the log, which can contain multiple lines
+        """
         buffer = self.textview.get_buffer()
 
         text = text.rstrip()
-        if buffer.get_char_count() > 0:
-            text = "\n" + text
+        added = text.count("\n") + 1
+        if self.lines > 0:
+            if len(text) > 128:
+                # Insert the separator on its own instead of copying a long
+                # text just to prepend a newline
+                buffer.insert(buffer.get_end_iter(), "\n")
+            else:
+                text = "\n" + text
         buffer.insert(buffer.get_end_iter(), text)
+        self.lines += added
 
-        if (lines := buffer.get_line_count()) > self.max_lines:
+        if self.lines > self.max_lines + self.trim_margin:
+            drop = self.lines - self.max_lines
             start = buffer.get_start_iter()
-            found, line1 = buffer.get_iter_at_line(lines - self.max_lines)
+            found, line1 = buffer.get_iter_at_line(drop)
             buffer.delete(start, line1)
+            self.lines -= drop
 
-        if (lines := buffer.get_line_count()) > 0:
-            found, line1 = buffer.get_iter_at_line(lines - 1)
-            mark = buffer.create_mark(None, line1, False)
-            self.textview.scroll_mark_onscreen(mark)
+        self.textview.scroll_mark_onscreen(self.end_mark)
 
 
 class GtkLoggingHandler(logging.Handler):
-    def __init__(self, view: LogView, level=logging.NOTSET):
+    def __init__(self, view: LogView, level=logging.NOTSET, fast_format: bool = False):
         super().__init__(level)
         self.view = view
+        # The handler is created in the GTK thread, which can append to the
+        # view directly
+        self.thread_ident = threading.get_ident()
+        # If True, render plain records as LOG_FORMAT would, without going
+        # through the Formatter
+        self.fast_format = fast_format
+        # Log lines waiting to be added to the view, and whether an idle
+        # callback to add them has already been scheduled
+        self.pending: deque[str] = deque()
+        self.pending_lock = threading.Lock()
+        self.drain_scheduled = False
 
     def emit(self, record):
-        line = self.format(record)
-        GLib.idle_add(self.view.append, line)
+        if self.fast_format and record.exc_info is None and not record.exc_text and record.stack_info is None:
+            line = f"{record.levelname} {record.name} {record.getMessage()}"
+        else:
+            line = self.format(record)
+        with self.pending_lock:
+            direct = not self.drain_scheduled and threading.get_ident() == self.thread_ident
+            if not direct:
+                self.pending.append(line.rstrip())
+                if self.drain_scheduled:
+                    return
+                self.drain_scheduled = True
+        if direct:
+            # Nothing is waiting to be appended before this line, so there is
+            # no need to go through the main loop
+            self.view.append(line)
+        else:
+            GLib.idle_add(self._drain)
+
+    def _drain(self) -> bool:
+        """
+        Add all pending lines to the view in one go
+        """
+        with self.pending_lock:
+            lines = self.pending
+            self.pending = deque()
+            self.drain_scheduled = False
+        self.view.append("\n".join(lines))
+        return False
 
 
 class GtkHub(Hub):
@@ -58,7 +116,19 @@ class GtkHub(Hub):
     def __init__(self, gtk_app: Gtk.Application, **kwargs):
         super().__init__(**kwargs)
         self.thread = threading.Thread(name=self.HUB, target=self.run)
+        # Identifier of the hub thread, set once it has started
+        self.thread_ident: int | None = None
         self.gtk_app = gtk_app
+        # Calls queued from other threads, and whether the hub thread has
+        # already been woken up to run them
+        self.inbox: deque[tuple[Callable, tuple[Any, ...], dict[str, Any]]] = deque()
+        self.inbox_lock = threading.Lock()
+        self.inbox_scheduled = False
+        # Persistent main loop source used to wake up the hub thread, instead
+        # of creating an idle source for each batch of calls
+        self.wakeup_fd = os.eventfd(0, os.EFD_NONBLOCK | os.EFD_CLOEXEC)
+        self.wakeup_source = GLib.unix_fd_add_full(
+                GLib.PRIORITY_DEFAULT_IDLE, self.wakeup_fd, GLib.IOCondition.IN, self._drain_inbox)
 
     def start(self):
         super().start()
@@ -67,15 +137,45 @@ class GtkHub(Hub):
     def join(self):
         super().join()
         self.thread.join()
+        with self.inbox_lock:
+            # Calls arriving from now on are queued and never run, like
+            # idle callbacks added after the main loop stopped
+            self.inbox_scheduled = True
+            GLib.source_remove(self.wakeup_source)
+            os.close(self.wakeup_fd)
 
     def _running_in_hub(self) -> bool:
-        return threading.current_thread() == self.thread
+        return threading.get_ident() == self.thread_ident
 
     def run_in_hub(self, f: Callable, *args, **kwargs):
-        if self._running_in_hub():
+        if threading.get_ident() == self.thread_ident:
             f(*args, **kwargs)
-        else:
-            GLib.idle_add(f, *args, **kwargs)
+            return
+        with self.inbox_lock:
+            self.inbox.append((f, args, kwargs))
+            if self.inbox_scheduled:
+                return
+            self.inbox_scheduled = True
+            os.eventfd_write(self.wakeup_fd, 1)
+
+    def _drain_inbox(self, fd: int, condition: GLib.IOCondition) -> bool:
+        """
+        Run all the calls queued from other threads
+        """
+        try:
+            os.eventfd_read(fd)
+        except BlockingIOError:
+            pass
+        with self.inbox_lock:
+            inbox = self.inbox
+            self.inbox = deque()
+            self.inbox_scheduled = False
+        for f, args, kwargs in inbox:
+            try:
+                f(*args, **kwargs)
+            except Exception:
+                self.logger.exception("%s: uncaught exception", f)
+        return True
 
     @check_hub
     def _hub_thread_receive(self, msg: Message):
@@ -84,6 +184,9 @@ class GtkHub(Hub):
             self.gtk_app.quit()
 
     def run(self):
+        # Set before anything can run in the main loop, so that check_hub and
+        # run_in_hub see the hub thread from the start
+        self.thread_ident = threading.get_ident()
         self.gtk_app.run(None)
         self.send(Shutdown())
         self.app.remove_hub(self)
@@ -124,9 +227,8 @@ class GtkApp(App):
             GLib.idle_add(self._setup_gtk_logging)
 
     def _setup_gtk_logging(self):
-        FORMAT = "%(levelname)s %(name)s %(message)s"
-        formatter = logging.Formatter(FORMAT)
-        log_handler = GtkLoggingHandler(self.logview)
+        formatter = logging.Formatter(LOG_FORMAT)
+        log_handler = GtkLoggingHandler(self.logview, fast_format=True)
         log_handler.setFormatter(formatter)
         # self.log_handler.propagate = False
         logging.getLogger().addHandler(log_handler)
@@ -13,13 +13,15 @@ if TYPE_CHECKING:
 
 
 class HubConfig(Message):
+    __slots__ = ("hub", "components")
+
     def __init__(self, *, hub: str, components: dict[str, dict[str, Any]], **kwargs):
         super().__init__(**kwargs)
         self.hub = hub
         self.components = components
 
     def __str__(self):
-        return super().__str__() + f"(hub={self.hub}, components={self.components!r})"
+        return f"{self.name}(hub={self.hub}, components={self.components!r})"
 
 
 class Hub:
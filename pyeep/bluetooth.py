@@ -30,7 +30,7 @@ class BluetoothDisconnect(Message):
     """
     Message used only internally to trigger handling a device disconnect
     """
-    pass
+    __slots__ = ()
 
 
 class BluetoothComponent(ConnectedComponent, AIOComponent):
@@ -20,9 +20,12 @@ class App(GtkApp, JackApp, AIOApp):
         super().__init__(args, **kwargs)
         self.add_component(MidiInput)
         synth = self.add_component(midisynth.Synth)
-        if args.controller:
+        if args.controller is not None:
             self.controller = self.add_component(PowerOutputBottomController, output=synth)
-            self.bottom = self.add_component(PowerOutputBottom, path=args.controller, controller=self.controller)
+            self.bottom = self.add_component(
+                PowerOutputBottom,
+                path=args.controller or None,
+                controller=self.controller)
         else:
             self.controller = self.add_component(
                 self.player.get_output_controller(),
@@ -41,7 +44,10 @@ class App(GtkApp, JackApp, AIOApp):
 
 def main():
     parser = App.argparser(name="midievents", description="MIDI event reader")
-    parser.add_argument("--controller", action="store", metavar="socket", help="Controller socket")
+    parser.add_argument(
+            "--controller", action="store", nargs="?", const="", metavar="socket",
+            help="Run under the control of another process, connecting to this socket."
+                 " A bare --controller uses the socket inherited from the controller process")
     args = parser.parse_args()
 
     with App(args, title="MIDI Events", application_id="org.enricozini.midievents") as app:
@@ -20,8 +20,8 @@ class App(GtkApp, JackApp, AIOApp):
         super().__init__(args, **kwargs)
         self.add_component(MidiInput)
         self.add_component(midisynth.Synth)
-        if args.controller:
-            self.add_component(BottomComponent, path=args.controller)
+        if args.controller is not None:
+            self.add_component(BottomComponent, path=args.controller or None)
 
     def build_main_window(self):
         super().build_main_window()
@@ -35,7 +35,10 @@ class App(GtkApp, JackApp, AIOApp):
 
 def main():
     parser = App.argparser(name="midisynth", description="Simple MIDI synthesizer")
-    parser.add_argument("--controller", action="store", metavar="socket", help="Controller socket")
+    parser.add_argument(
+            "--controller", action="store", nargs="?", const="", metavar="socket",
+            help="Run under the control of another process, connecting to this socket."
+                 " A bare --controller uses the socket inherited from the controller process")
     args = parser.parse_args()
 
     with App(args, title="MIDI Synth", application_id="org.enricozini.midisynth") as app:
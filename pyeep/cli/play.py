@@ -47,17 +47,17 @@ class ScanAction(Component):
 
 class MidiSynthesizer(TopComponent):
     def get_commandline(self):
-        return ["python3", "-m", "pyeep.cli.midisynth", "--controller", self.workdir / "socket"]
+        return ["python3", "-m", "pyeep.cli.midisynth", "--controller"]
 
 
 class MidiInputReader(TopComponent):
     def get_commandline(self):
-        return ["python3", "-m", "pyeep.cli.midievents", "--controller", self.workdir / "socket"]
+        return ["python3", "-m", "pyeep.cli.midievents", "--controller"]
 
 
 class PulsesPlayer(PowerOutputTop):
     def get_commandline(self):
-        return ["python3", "-m", "pyeep.cli.audiopulses", "--controller", self.workdir / "socket"]
+        return ["python3", "-m", "pyeep.cli.audiopulses", "--controller"]
 
 
 class App(GtkApp, AIOApp):
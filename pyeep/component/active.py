@@ -62,13 +62,20 @@ class ActiveControllerWidget(ControllerWidget):
 
 
 class ActiveController(Controller[C]):
+    # GVariants are immutable: share the two possible action states
+    ACTIVE_STATES = (GLib.Variant.new_boolean(False), GLib.Variant.new_boolean(True))
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+        self._action_name = self.name.replace("_", "-") + "-active"
+        # Last known active state, to avoid querying the GVariant state of
+        # the action every time
+        self._active_state: bool = self.component.is_active
         self.active = Gio.SimpleAction.new_stateful(
-                name=self.name.replace("_", "-") + "-active",
+                name=self._action_name,
                 parameter_type=None,
-                state=GLib.Variant.new_boolean(self.component.is_active))
+                state=self.ACTIVE_STATES[self._active_state])
         self.active.connect("activate", self.on_activate)
         self.hub.gtk_app.add_action(self.active)
 
@@ -79,12 +86,14 @@ class ActiveController(Controller[C]):
     def receive(self, msg: Message):
         match msg:
             case ComponentActiveStateChanged():
-                if msg.src == self.component and self.active.get_state().get_boolean() != msg.value:
-                    self.active.set_state(GLib.Variant.new_boolean(msg.value))
+                if msg.src == self.component and self._active_state != msg.value:
+                    self._active_state = msg.value
+                    self.active.set_state(self.ACTIVE_STATES[msg.value])
 
     def on_activate(self, action, parameter):
-        new_state = not self.active.get_state().get_boolean()
-        self.active.set_state(GLib.Variant.new_boolean(new_state))
+        new_state = not self._active_state
+        self._active_state = new_state
+        self.active.set_state(self.ACTIVE_STATES[new_state])
         self.component.set_active(new_state)
 
     def build(self) -> ControllerWidget:
@@ -92,5 +101,5 @@ class ActiveController(Controller[C]):
         Build the component view
         """
         cw = super().build()
-        cw.active.set_action_name("app." + self.active.get_name())
+        cw.active.set_action_name("app." + self._action_name)
         return cw
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 
 from ..messages.message import Message
 from .base import Component, check_hub
@@ -14,23 +15,45 @@ class AIOComponent(Component):
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.message_queue: asyncio.Queue[Message] = asyncio.Queue()
+        # Messages are produced by the hub and consumed only by this
+        # component's run(): a deque and an event to wake up the consumer are
+        # all that is needed
+        self.message_queue: deque[Message] = deque()
+        self.message_event = asyncio.Event()
 
     @check_hub
     def receive(self, msg: Message):
-        self.message_queue.put_nowait(msg)
+        self.message_queue.append(msg)
+        self.message_event.set()
 
     @check_hub
     async def next_message(self, *, timeout: float | None = None) -> Message | None:
         """
         Wait for reception of a message, with an optional timeout
         """
-        try:
-            msg = await asyncio.wait_for(self.message_queue.get(), timeout=timeout)
-            self.message_queue.task_done()
-            return msg
-        except TimeoutError:
-            return None
+        if timeout is not None:
+            # Wake-ups that leave the queue empty do not extend the timeout
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+        while not self.message_queue:
+            self.message_event.clear()
+            if timeout is None:
+                await self.message_event.wait()
+            else:
+                try:
+                    await asyncio.wait_for(self.message_event.wait(), timeout=deadline - loop.time())
+                except TimeoutError:
+                    return None
+        return self.message_queue.popleft()
+
+    @check_hub
+    def next_messages(self) -> list[Message]:
+        """
+        Dequeue all the messages received so far, without waiting
+        """
+        res = list(self.message_queue)
+        self.message_queue.clear()
+        return res
 
     async def run(self) -> None:
         """
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import functools
 import logging
-import time
 from typing import TYPE_CHECKING, Any, Type
 
 if TYPE_CHECKING:
@@ -77,8 +76,6 @@ class Component:
         Send a message to other components
         """
         msg.src = self
-        if msg.ts is None:
-            msg.ts = time.time()
         if self.hub is not None:
             self.hub.send(msg)
 
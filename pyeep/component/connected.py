@@ -15,12 +15,14 @@ class ConnectedStateChanged(Message):
     """
     Notify a change of connected state for an input
     """
+    __slots__ = ("value",)
+
     def __init__(self, *, value: ConnectedState, **kwargs):
         super().__init__(**kwargs)
         self.value = value
 
     def __str__(self) -> str:
-        return super().__str__() + f"(value={self.value})"
+        return f"{self.name}(value={self.value})"
 
 
 class ConnectedState(StrEnum):
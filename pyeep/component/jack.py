@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import threading
+from typing import Callable
 
 import jack
 
@@ -39,6 +40,10 @@ class Jack(AIOComponent):
         self.jack_client.set_process_callback(self.jack_process)
         self.samplerate = self.jack_client.samplerate
         self.jack_components: list["JackComponent"] = []
+        # Bound jack_process methods of jack_components, rebuilt when
+        # components are added or removed, so that the realtime thread does
+        # not look them up at each period
+        self.jack_callbacks: tuple[Callable[[int], None], ...] = ()
         self.jack_components_lock = threading.Lock()
 
     def jack_process(self, frames: int):
@@ -46,8 +51,8 @@ class Jack(AIOComponent):
         JACK process function, running in JACK's realtime thread
         """
         with self.jack_components_lock:
-            for c in self.jack_components:
-                c.jack_process(frames)
+            for cb in self.jack_callbacks:
+                cb(frames)
 
     def add_jack_component(self, component: JackComponent) -> None:
         """
@@ -60,6 +65,7 @@ class Jack(AIOComponent):
             if component not in self.jack_components:
                 component.set_jack_client(self.jack_client)
                 self.jack_components.append(component)
+                self.jack_callbacks = tuple(c.jack_process for c in self.jack_components)
 
     def remove_jack_component(self, component: JackComponent) -> None:
         """
@@ -67,11 +73,12 @@ class Jack(AIOComponent):
 
         If the comnponent is not present, nothing will happen
         """
-        with self.process_callbacks_lock:
+        with self.jack_components_lock:
             try:
                 self.jack_components.remove(component)
             except ValueError:
-                pass
+                return
+            self.jack_callbacks = tuple(c.jack_process for c in self.jack_components)
 
     async def run(self) -> None:
         """
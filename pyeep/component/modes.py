@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from typing import Iterator, NamedTuple, TypeVar
+from types import FunctionType
+from typing import Callable, Iterator, NamedTuple, TypeVar
 
 from .base import Component, export
 from ..gtk import Gtk
@@ -22,25 +23,47 @@ class ModeComponent(Component):
     """
     Mixin for components to implement multiple operational modes
     """
+    # Map mode names to their method and description, computed once per class
+    # instead of introspecting each new object
+    MODES: dict[str, tuple[FunctionType, ModeInfo]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        modes: dict[str, tuple[FunctionType, ModeInfo]] = {}
+        seen: set[str] = set()
+        for base in cls.__mro__:
+            for name, value in base.__dict__.items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                if not name.startswith("mode_") or not isinstance(value, FunctionType):
+                    continue
+                modes[name[5:]] = (value, ModeInfo(name[5:], inspect.getdoc(value) or name))
+        cls.MODES = dict(sorted(modes.items()))
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.mode: Callable
         self.set_mode("default")
 
     def list_modes(self) -> Iterator[ModeInfo]:
         """
         List available modes
         """
-        for name, value in inspect.getmembers(self, inspect.ismethod):
-            if not name.startswith("mode_"):
-                continue
-            yield ModeInfo(name[5:], inspect.getdoc(value) or name)
+        for method, info in self.MODES.values():
+            yield info
 
     @export
     def set_mode(self, name: str) -> None:
         """
         Set the active mode
         """
-        self.mode = getattr(self, "mode_" + name)
+        try:
+            method = self.MODES[name][0]
+        except KeyError:
+            # Raise the same error as looking up the method by name
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute 'mode_{name}'") from None
+        self.mode = method.__get__(self)
 
 
 class ModeController(Controller[C]):
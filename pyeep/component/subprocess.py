@@ -1,29 +1,69 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import tempfile
+import os
+import socket
 from pathlib import Path
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
 from ..messages.component import Shutdown
 from ..messages.jsonable import Jsonable
 from .aio import AIOComponent
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ModuleNotFoundError:
+    import json
+    HAVE_ORJSON = False
+
 if TYPE_CHECKING:
     from ..messages.message import Message
 
 
+if HAVE_ORJSON:
+    def json_dumps(data: dict[str, Any]) -> bytes:
+        """
+        Encode data as a JSON line
+        """
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(data: dict[str, Any]) -> bytes:
+        """
+        Encode data as a JSON line
+        """
+        return json.dumps(data).encode() + b"\n"
+
+    json_loads = json.loads
+
+
 # See https://bugs.python.org/issue43884
 # It looks like asyncio is currently not very good at doing subprocess pipes
 # reading from stdout, and a Unix Domain Socket is a working and more stable
 # replacement
+#
+# The TopComponent creates a connected socket pair and passes one end to the
+# child process, which finds its file descriptor number in this environment
+# variable
+SOCKET_FD_ENV = "PYEEP_SOCKET_FD"
 
 
 class SubprocessComponent(AIOComponent):
     """
     Common functionality for the top and bottom end of a subprocess component
     """
+    # Maximum size of each read from the remote endpoint
+    read_size = 65536
+    # Amount of buffered outgoing data above which writing waits for it to be
+    # sent
+    write_high_water = 65536
+    # Buffer limit for the stream reader
+    stream_limit = 1 << 20
+    # Kernel send and receive buffer size requested for the socket
+    socket_buffer_size = 1 << 20
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.reader: asyncio.StreamReader | None = None
@@ -32,35 +72,59 @@ class SubprocessComponent(AIOComponent):
         self.write_messages_task: asyncio.Task | None = None
         self.outbox = asyncio.Queue()
 
-    async def _read_messages(self):
+    async def _read_message(self, line: bytes):
         """
-        Task used to read messages from the remote endpoint
+        Decode and process a line received from the remote endpoint
         """
+        jsonable = json_loads(line)
+        cls = Jsonable.jsonable_class(jsonable)
+        if cls is None:
+            return
+
+        jsonable["src"] = self
+
         try:
-            while (line := await self.reader.readline()):
-                jsonable = json.loads(line)
-                cls = Jsonable.jsonable_class(jsonable)
-                if cls is None:
-                    continue
+            msg = cls(**jsonable)
+        except Exception as e:
+            self.logger.error("cannot instantiate message: %s", e)
+            return
 
-                jsonable["src"] = self
+        await self.process_remote_message(msg)
 
-                try:
-                    msg = cls(**jsonable)
-                except Exception as e:
-                    self.logger.error("cannot instantiate message: %s", e)
+    async def _read_messages(self):
+        """
+        Task used to read messages from the remote endpoint
+        """
+        # Read all the data available at each wakeup and split it into lines
+        # here, rather than awaiting readline for each message
+        # Data after the last newline is kept in a bytearray, and only new
+        # data is scanned for newlines, to avoid copying long lines at each
+        # read
+        partial = bytearray()
+        try:
+            while (data := await self.reader.read(self.read_size)):
+                if (pos := data.rfind(b"\n")) == -1:
+                    partial += data
                     continue
-
-                await self.process_remote_message(msg)
+                end = len(partial) + pos
+                partial += data
+                lines = partial[:end].split(b"\n")
+                del partial[:end + 1]
+                for line in lines:
+                    if line:
+                        await self._read_message(line)
+            if partial.strip():
+                await self._read_message(partial)
         finally:
             self.receive(Shutdown())
 
     async def _write_messages(self):
         while True:
             msg = await self.outbox.get()
-            line = json.dumps(msg.as_jsonable()) + "\n"
-            self.writer.write(line.encode())
-            if self.outbox.empty():
+            self.writer.write(json_dumps(msg.as_jsonable()))
+            # The transport sends data as soon as it can: only wait for it
+            # when too much has accumulated
+            if self.writer.transport.get_write_buffer_size() > self.write_high_water:
                 await self.writer.drain()
             self.outbox.task_done()
 
@@ -70,6 +134,9 @@ class SubprocessComponent(AIOComponent):
         """
         self.reader = reader
         self.writer = writer
+        if (sock := writer.get_extra_info("socket")) is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.socket_buffer_size)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.socket_buffer_size)
         self.read_messages_task = asyncio.create_task(self._read_messages())
         self.write_messages_task = asyncio.create_task(self._write_messages())
 
@@ -119,8 +186,6 @@ class TopComponent(SubprocessComponent):
         super().__init__(**kwargs)
         self.proc: asyncio.subprocess.Process | None = None
         self.returncode: int | None = None
-        self.workdir: Path | None = None
-        self.server: asyncio.Server | None = None
 
     def get_commandline(self) -> Sequence[str]:
         raise NotImplementedError(f"{self.__class__.__name__}.get_commandline not implemented")
@@ -143,40 +208,53 @@ class TopComponent(SubprocessComponent):
         finally:
             self.proc = None
 
-    async def on_server_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        self._on_connect(reader, writer)
-
     async def run(self):
-        with tempfile.TemporaryDirectory() as workdir_str:
-            self.workdir = Path(workdir_str)
-            self.server = await asyncio.start_unix_server(
-                    self.on_server_connect,
-                    path=self.workdir / "socket")
-
+        parent_sock, child_sock = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            child_fd = child_sock.fileno()
             self.proc = await asyncio.create_subprocess_exec(
-                    *self.get_commandline())
+                    *self.get_commandline(),
+                    pass_fds=(child_fd,),
+                    env={**os.environ, SOCKET_FD_ENV: str(child_fd)})
+        except BaseException:
+            parent_sock.close()
+            raise
+        finally:
+            # The child has its own copy now
+            child_sock.close()
 
-            try:
-                await self.main_loop()
-            finally:
-                if self.proc is not None:
-                    await self._terminate_process()
+        try:
+            reader, writer = await asyncio.open_unix_connection(sock=parent_sock, limit=self.stream_limit)
+            self._on_connect(reader, writer)
+            await self.main_loop()
+        finally:
+            if self.proc is not None:
+                await self._terminate_process()
 
 
 class BottomComponent(SubprocessComponent):
     """
     Component that interfaces with a controller program.
 
-    This is the remote controlled by a TopComponent
+    This is the remote controlled by a TopComponent.
+
+    If path is None, connect using the socket inherited from the TopComponent
     """
-    def __init__(self, path: Path, **kwargs):
+    def __init__(self, path: Path | None = None, **kwargs):
         super().__init__(**kwargs)
         self.path = path
         self.read_messages_task: asyncio.Task | None = None
         self.returncode: int | None = None
-        self.workdir: Path | None = None
 
     async def run(self):
-        reader, writer = await asyncio.open_unix_connection(path=self.path)
+        if self.path is None:
+            # Consume the variable, so that processes started from here do
+            # not inherit a file descriptor number that is not theirs
+            if (fd := os.environ.pop(SOCKET_FD_ENV, None)) is None:
+                raise RuntimeError(f"no controller socket path given, and {SOCKET_FD_ENV} is not set")
+            reader, writer = await asyncio.open_unix_connection(
+                    sock=socket.socket(fileno=int(fd)), limit=self.stream_limit)
+        else:
+            reader, writer = await asyncio.open_unix_connection(path=self.path, limit=self.stream_limit)
         self._on_connect(reader, writer)
         await self.main_loop()
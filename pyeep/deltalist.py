@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from collections import deque
+import copy
+import heapq
+import itertools
 from typing import TypeVar, Generic
 
 
@@ -8,6 +10,8 @@ class Event:
     """
     Generic event, timed by frame counts
     """
+    __slots__ = ("frame_delay",)
+
     def __init__(self, *, frame_delay: int = 0):
         self.frame_delay: int = frame_delay
 
@@ -21,32 +25,35 @@ class DeltaList(Generic[EventType]):
     they are scheduled to happen
     """
     def __init__(self) -> None:
-        self.events: deque[EventType] = deque()
+        # Frame count at the start of the current clock tick
+        self.now: int = 0
+        # Heap of (absolute frame, insertion sequence, event). The sequence
+        # number keeps events scheduled on the same frame in insertion order
+        self.queue: list[tuple[int, int, EventType]] = []
+        self.sequence = itertools.count()
+
+    @property
+    def events(self) -> list[EventType]:
+        """
+        Return copies of the queued events in order, with frame_delay set to
+        the delay from the previous event.
+
+        The queued events are left untouched
+        """
+        res: list[EventType] = []
+        last = self.now
+        for frame, seq, evt in sorted(self.queue):
+            evt = copy.copy(evt)
+            evt.frame_delay = frame - last
+            last = frame
+            res.append(evt)
+        return res
 
     def add_event(self, event: EventType):
         """
         Enqueue an event at its frame_delay position.
         """
-        if not self.events:
-            self.events.append(event)
-            return
-
-        insert_index: int | None = None
-        for idx, evt in enumerate(self.events):
-            if event.frame_delay < evt.frame_delay:
-                evt.frame_delay -= event.frame_delay
-                insert_index = idx
-                break
-            else:
-                event.frame_delay -= evt.frame_delay
-
-        match insert_index:
-            case None:
-                self.events.append(event)
-            case 0:
-                self.events.appendleft(event)
-            case _:
-                self.events.insert(idx, event)
+        heapq.heappush(self.queue, (self.now + event.frame_delay, next(self.sequence), event))
 
     def clock_tick(self, frames: int) -> list[EventType]:
         """
@@ -55,13 +62,18 @@ class DeltaList(Generic[EventType]):
         Get a list with the events that happen in this clock tick, sorted by
         frame delay from the start of the clock tick.
         """
+        queue = self.queue
+        now = self.now
+        end = now + frames
+        self.now = end
+        # Most ticks have nothing to play
+        if not queue or queue[0][0] >= end:
+            return []
+
         res: list[EventType] = []
-        while self.events and self.events[0].frame_delay < frames:
-            evt = self.events.popleft()
-            frames -= evt.frame_delay
-            if res:
-                evt.frame_delay += res[-1].frame_delay
+        heappop = heapq.heappop
+        while queue and queue[0][0] < end:
+            frame, seq, evt = heappop(queue)
+            evt.frame_delay = frame - now
             res.append(evt)
-        if self.events:
-            self.events[0].frame_delay -= frames
         return res
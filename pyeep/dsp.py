@@ -2,10 +2,68 @@ from __future__ import annotations
 
 from typing import Sequence
 
+import numba
 import numpy
 import scipy.signal
 
 
+@numba.njit(cache=True)
+def _sosfilt_step(sos: numpy.ndarray, z: numpy.ndarray, index: int, sections: int, x: float) -> float:
+    """
+    Filter one sample through the second-order sections of filter index in a
+    ButterworthBank, updating its filter state in place.
+
+    This is the same transposed direct form II computation done by
+    scipy.signal.sosfilt, without its per-call overhead
+    """
+    for s in range(sections):
+        y = sos[index, s, 0] * x + z[index, s, 0]
+        z[index, s, 0] = sos[index, s, 1] * x - sos[index, s, 4] * y + z[index, s, 1]
+        z[index, s, 1] = sos[index, s, 2] * x - sos[index, s, 5] * y
+        x = y
+    return x
+
+
+class ButterworthBank:
+    """
+    Storage for the coefficients and state of a group of Butterworth filters.
+
+    Filters are stored next to each other in shared contiguous arrays, which
+    keeps their state close in memory when many filters run in sequence
+    """
+    def __init__(self, max_sections: int = 8):
+        self.max_sections = max_sections
+        # Second-order sections, indexed by filter and section
+        self.sos = numpy.zeros((0, max_sections, 6))
+        # Filter state, indexed by filter and section
+        self.z = numpy.zeros((0, max_sections, 2))
+
+    def add(
+            self,
+            rate: int,
+            cutoff: float | Sequence[float],
+            btype: str = "low",
+            order: int = 3) -> Butterworth:
+        """
+        Create a new filter stored in this bank
+        """
+        return Butterworth(rate, cutoff, btype=btype, order=order, bank=self)
+
+    def register(self, sos: numpy.ndarray) -> int:
+        """
+        Add storage for a filter with the given second-order sections,
+        returning its index in the bank
+        """
+        if len(sos) > self.max_sections:
+            raise ValueError(f"filter has {len(sos)} sections, but the bank only allows {self.max_sections}")
+        index = len(self.sos)
+        padded = numpy.zeros((1, self.max_sections, 6))
+        padded[0, :len(sos)] = sos
+        self.sos = numpy.concatenate((self.sos, padded))
+        self.z = numpy.concatenate((self.z, numpy.zeros((1, self.max_sections, 2))))
+        return index
+
+
 class Butterworth:
     """
     Butterworth filter function
@@ -22,12 +80,52 @@ class Butterworth:
             rate: int,
             cutoff: float | Sequence[float],
             btype: str = "low",
-            order: int = 3):
-        self.sos = scipy.signal.butter(order, cutoff, btype=btype, output="sos", fs=rate)
-        self.z: numpy.ndarray | None = None
+            order: int = 3,
+            bank: ButterworthBank | None = None):
+        sos = scipy.signal.butter(order, cutoff, btype=btype, output="sos", fs=rate)
+        if bank is None:
+            # Standalone filter: use a bank of its own
+            bank = ButterworthBank(max_sections=len(sos))
+        self.bank = bank
+        self.sections = len(sos)
+        self.index = bank.register(sos)
+        # Set to True when the filter state has been initialized from the
+        # first sample
+        self.primed = False
+
+    @property
+    def sos(self) -> numpy.ndarray:
+        return self.bank.sos[self.index, :self.sections]
+
+    @property
+    def z(self) -> numpy.ndarray:
+        return self.bank.z[self.index, :self.sections]
+
+    def _init_state(self, sample: float) -> None:
+        """
+        Initialize the filter state for a steady input at the given value
+        """
+        self.bank.z[self.index, :self.sections] = scipy.signal.sosfilt_zi(self.sos) * sample
+        self.primed = True
 
     def __call__(self, sample: float) -> float:
-        if self.z is None:
-            self.z = scipy.signal.sosfilt_zi(self.sos) * sample
-        filtered, self.z = scipy.signal.sosfilt(self.sos, [sample], zi=self.z)
-        return filtered[0]
+        """
+        Filter a single sample
+        """
+        if not self.primed:
+            self._init_state(sample)
+        return _sosfilt_step(self.bank.sos, self.bank.z, self.index, self.sections, sample)
+
+    def process(self, block: numpy.ndarray) -> numpy.ndarray:
+        """
+        Filter a block of samples, returning the filtered block.
+
+        This pays the overhead of scipy.signal.sosfilt once per block, and
+        can be freely mixed with calls filtering single samples
+        """
+        if len(block) == 0:
+            return numpy.zeros(0)
+        if not self.primed:
+            self._init_state(block[0])
+        filtered, self.bank.z[self.index, :self.sections] = scipy.signal.sosfilt(self.sos, block, zi=self.z)
+        return filtered
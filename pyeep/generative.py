@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pyeep.jackmidi import MidiPlayer
+from pyeep.midi import encode_message
 
 DRUM_CHANNEL = 9
 DRUM_ACOUSTIC_BASS = 35
@@ -32,23 +33,30 @@ class GenerativeScore:
     def beat(self):
         self.beat_number += 1
 
-    def drum(self, note: int, position: float, duration: float, velocity: int = 127):
+    def _play_note(self, channel: int, note: int, position: float, duration: float, velocity: int):
+        """
+        Enqueue the note_on and note_off messages for a note
+        """
         beat = 60 / self.bpm
         delay = beat * position
-        self.player.play("note_on", velocity=velocity, note=note, channel=DRUM_CHANNEL, delay_sec=delay)
-        self.player.play("note_off", note=note, channel=DRUM_CHANNEL, delay_sec=delay + beat * duration)
+        self.player.play_batch((
+            (delay, encode_message("note_on", channel=channel, note=note, velocity=velocity)),
+            (delay + beat * duration, encode_message("note_off", channel=channel, note=note)),
+        ))
+
+    def drum(self, note: int, position: float, duration: float, velocity: int = 127):
+        self._play_note(DRUM_CHANNEL, note, position, duration, velocity)
 
     def note(self, note: int, position: float, duration: float, velocity: int = 127):
-        beat = 60 / self.bpm
-        delay = beat * position
-        self.player.play("note_on", velocity=velocity, note=note, channel=self.channel, delay_sec=delay)
-        self.player.play("note_off", note=note, channel=self.channel, delay_sec=delay + beat * duration)
+        self._play_note(self.channel, note, position, duration, velocity)
 
     def bank_program_select(self, bank: int, program: int, position: int = 0):
         # https://www.sweetwater.com/sweetcare/articles/6-what-msb-lsb-refer-for-changing-banks-andprograms/
         # FIXME: I cannot seem to be able to make this work with fluidsynth
         beat = 60 / self.bpm
         delay = beat * position
-        self.player.play("control_change", channel=self.channel, control=0, value=bank >> 8, delay_sec=delay)
-        self.player.play("control_change", channel=self.channel, control=32, value=bank & 0xff, delay_sec=delay)
-        self.player.play("program_change", channel=self.channel, program=program, delay_sec=delay)
+        self.player.play_batch((
+            (delay, encode_message("control_change", channel=self.channel, control=0, value=bank >> 8)),
+            (delay, encode_message("control_change", channel=self.channel, control=32, value=bank & 0xff)),
+            (delay, encode_message("program_change", channel=self.channel, program=program)),
+        ))
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import os
+import struct
 from pathlib import Path
-from typing import Type
+from typing import Iterable, Type
 
 import aionotify
 import evdev
@@ -12,6 +14,9 @@ from ..messages.component import Shutdown
 from ..component.active import SimpleActiveComponent
 from .base import Input
 
+# struct input_event: struct timeval, then type, code and value
+INPUT_EVENT = struct.Struct("llHHi")
+
 
 class EvdevInput(SimpleActiveComponent, Input, AIOComponent):
     """
@@ -30,13 +35,51 @@ class EvdevInput(SimpleActiveComponent, Input, AIOComponent):
     async def on_evdev(self, ev: evdev.InputEvent):
         print(repr(ev))
 
+    async def on_evdev_raw(self, sec: int, usec: int, type: int, code: int, value: int):
+        """
+        Handle an event as read from the device.
+
+        By default this builds an evdev.InputEvent and passes it to
+        on_evdev: override this to skip creating it
+        """
+        await self.on_evdev(evdev.InputEvent(sec, usec, type, code, value))
+
+    async def on_evdev_batch(self, events: Iterable[tuple[int, int, int, int, int]]):
+        """
+        Handle all the events read from the device in one go, as
+        (sec, usec, type, code, value) tuples.
+
+        By default this calls on_evdev_raw for each event
+        """
+        for sec, usec, type, code, value in events:
+            await self.on_evdev_raw(sec, usec, type, code, value)
+
     async def read_events(self):
+        # Read and decode input_event structures directly from the device,
+        # instead of going through async_read_loop, which builds an
+        # InputEvent for each of them
+        loop = asyncio.get_running_loop()
+        fd = self.device.fd
+        readable = asyncio.Event()
+        loop.add_reader(fd, readable.set)
         try:
-            async for ev in self.device.async_read_loop():
-                await self.on_evdev(ev)
+            while True:
+                await readable.wait()
+                readable.clear()
+                # Drain everything the device has queued before waiting again
+                while True:
+                    try:
+                        buf = os.read(fd, INPUT_EVENT.size * 64)
+                    except BlockingIOError:
+                        break
+                    if not buf:
+                        break
+                    await self.on_evdev_batch(INPUT_EVENT.iter_unpack(buf))
         except OSError as e:
             self.logger.error("%s: %s", self.path, e)
             self.receive(Shutdown())
+        finally:
+            loop.remove_reader(fd)
 
     async def run(self):
         async with asyncio.TaskGroup() as tg:
@@ -95,12 +138,11 @@ class EvdevDeviceManager(AIOComponent):
             alias='devices',
             path=self.root.as_posix(),
             flags=aionotify.Flags.CREATE | aionotify.Flags.DELETE | aionotify.Flags.MOVED_TO)
-        await self.watcher.setup(asyncio.get_event_loop())
+        await self.watcher.setup(asyncio.get_running_loop())
 
-        # Enumerate existing devices
-        for path in self.root.iterdir():
-            if path.name.startswith("."):
-                continue
+        # Enumerate existing devices, closing the directory before awaiting
+        paths = sorted(p for p in self.root.iterdir() if not p.name.startswith("."))
+        for path in paths:
             await self.device_added(path)
 
         try:
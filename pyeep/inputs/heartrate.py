@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 import time
 from typing import NamedTuple, Type
 
@@ -9,12 +10,31 @@ from .. import bluetooth
 from ..component.controller import ControllerWidget
 from ..component.active import SimpleActiveComponent
 from ..component.connected import ConnectedController
-from ..gtk import Gtk
+from ..gtk import GLib, Gtk
 from ..messages.message import Message
 from .base import Input, InputController
 
 HEART_RATE_UUID = "00002a37-0000-1000-8000-00805f9b34fb"
 
+UINT16 = struct.Struct("<H")
+
+# Decoded flags byte of heart rate notifications, indexed by its value:
+# (heart rate is uint8, energy expended present, RR intervals present)
+FLAGS = [((b & 1) == 0, ((b >> 3) & 1) == 1, ((b >> 4) & 1) == 1) for b in range(256)]
+
+
+# Structs decoding a given number of little endian RR interval values
+RR_STRUCTS = {count: struct.Struct(f"<{count}H") for count in range(1, 33)}
+
+
+def _rr_struct(count: int) -> struct.Struct:
+    """
+    Return a Struct decoding count little endian RR interval values
+    """
+    if (res := RR_STRUCTS.get(count)) is None:
+        res = RR_STRUCTS[count] = struct.Struct(f"<{count}H")
+    return res
+
 
 class Sample(NamedTuple):
     """
@@ -30,12 +50,14 @@ class HeartBeat(Message):
     """
     Heartbeat information notification event
     """
+    __slots__ = ("sample",)
+
     def __init__(self, *, sample: Sample, **kwargs):
         super().__init__(**kwargs)
         self.sample = sample
 
     def __str__(self):
-        return super().__str__() + f"(sample={self.sample})"
+        return f"{self.name}(sample={self.sample})"
 
 
 class HeartRateMonitor(SimpleActiveComponent, Input, bluetooth.BluetoothComponent):
@@ -62,10 +84,9 @@ class HeartRateMonitor(SimpleActiveComponent, Input, bluetooth.BluetoothComponen
         # see https://help.elitehrv.com/article/67-what-are-r-r-intervals
         # log.info("%s: %r", characteristic.description, data)
 
-        byte0 = data[0]
-        hrv_uint8 = (byte0 & 1) == 0
+        hrv_uint8, have_ee, have_rr = FLAGS[data[0]]
 
-        # sensor_contact = (byte0 >> 1) & 3
+        # sensor_contact = (data[0] >> 1) & 3
         # if sensor_contact == 2:
         #     res["sensor_contact"] = "No contact detected"
         # elif sensor_contact == 3:
@@ -73,32 +94,23 @@ class HeartRateMonitor(SimpleActiveComponent, Input, bluetooth.BluetoothComponen
         # else:
         #     res["sensor_contact"] = "Sensor contact not supported"
 
-        # Energy expended present
-        have_ee = ((byte0 >> 3) & 1) == 1
-
-        # RR intervals present
-        have_rr = ((byte0 >> 4) & 1) == 1
-
         if hrv_uint8:
             hr = data[1]
             i = 2
         else:
-            hr = (data[2] << 8) | data[1]
+            hr = UINT16.unpack_from(data, 1)[0]
             i = 3
 
         if have_ee:
             # ee = (data[i + 1] << 8) | data[i]
             i += 2
 
-        rr: list[float] = []
-        if have_rr:
-            while i < len(data):
-                # Note: Need to divide the value by 1024 to get in seconds
-                rr_val = (data[i + 1] << 8) | data[i]
-                rr.append(rr_val / 1024)
-                i += 2
+        rr: tuple[float, ...] = ()
+        if have_rr and (count := (len(data) - i) // 2):
+            # Note: Need to divide the value by 1024 to get in seconds
+            rr = tuple(v / 1024 for v in _rr_struct(count).unpack_from(data, i))
 
-        sample = Sample(time=time.time_ns(), rate=float(hr), rr=tuple(rr))
+        sample = Sample(time=time.time_ns(), rate=float(hr), rr=rr)
         self.on_sample(sample)
 
     def on_sample(self, sample: Sample):
@@ -116,6 +128,21 @@ class HeartRateInputController(ConnectedController[HeartRateMonitor], InputContr
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_rate = Gtk.Label(label="-- BPM")
+        # Latest rate to show, set when a label update is already scheduled
+        self.pending_rate: float | None = None
+        # Rate currently shown in the label
+        self.shown_rate: float | None = None
+
+    def _update_label(self) -> bool:
+        """
+        Show the latest received rate
+        """
+        # Heart rate changes slowly: only touch the label when it changes
+        if self.pending_rate != self.shown_rate:
+            self.current_rate.set_label(f"{self.pending_rate} BPM")
+            self.shown_rate = self.pending_rate
+        self.pending_rate = None
+        return False
 
     def build(self) -> ControllerWidget:
         cw = super().build()
@@ -128,6 +155,9 @@ class HeartRateInputController(ConnectedController[HeartRateMonitor], InputContr
 
         match msg:
             case HeartBeat():
-                self.current_rate.set_label(f"{msg.sample.rate} BPM")
+                # Update the label once per burst of heartbeats
+                if self.pending_rate is None:
+                    GLib.idle_add(self._update_label, priority=GLib.PRIORITY_LOW)
+                self.pending_rate = msg.sample.rate
             case _:
                 super().receive(msg)
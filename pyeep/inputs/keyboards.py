@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+import types
+from collections.abc import Iterable, Mapping
+
 import evdev
 
 from ..messages.input import EmergencyStop, Shortcut
 from .evdev import EvdevInput
 
+# Event types checked for every event by the evdev inputs
+EV_KEY = evdev.ecodes.EV_KEY
+EV_SYN = evdev.ecodes.EV_SYN
+EV_MSC = evdev.ecodes.EV_MSC
+
+
+def key_table(key_map: Mapping[int, str]) -> tuple[str | None, ...]:
+    """
+    Turn a map from key codes to values into a tuple indexed by key code
+    """
+    res: list[str | None] = [None] * (max(key_map) + 1)
+    for code, value in key_map.items():
+        res[code] = value
+    return tuple(res)
+
 
 class CNCControlPanel(EvdevInput):
     """
@@ -12,7 +30,7 @@ class CNCControlPanel(EvdevInput):
     """
     # this has been tested with
     # https://www.amazon.com/Engraving-Controller-Handwheel-Electronic-Handbrake/dp/B09CMKRYTP
-    KEY_MAP = {
+    KEY_MAP = types.MappingProxyType({
         evdev.ecodes.KEY_GRAVE: "EMERGENCY",
         # InputEvent(EV_KEY, KEY_LEFTALT, 1)
         evdev.ecodes.KEY_R: "CYCLE START",
@@ -46,7 +64,9 @@ class CNCControlPanel(EvdevInput):
         evdev.ecodes.KEY_Q: "-A",
         evdev.ecodes.KEY_PAGEDOWN: "-Z",
         evdev.ecodes.KEY_PAGEUP: "+Z",
-    }
+    })
+    # KEY_MAP as a tuple indexed by key code
+    KEY_TABLE = key_table(KEY_MAP)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -57,11 +77,18 @@ class CNCControlPanel(EvdevInput):
         return f"CNC {self.device.name}"
 
     async def on_evdev(self, ev: evdev.InputEvent):
-        if ev.type != evdev.ecodes.EV_KEY:
+        self._on_key(ev.type, ev.code, ev.value)
+
+    async def on_evdev_raw(self, sec: int, usec: int, type: int, code: int, value: int):
+        # Handle the raw values without building an InputEvent
+        self._on_key(type, code, value)
+
+    def _on_key(self, type: int, code: int, value: int) -> None:
+        if type != EV_KEY:
             return
-        if ev.value == 0:
+        if value == 0:
             return
-        if (val := self.KEY_MAP.get(ev.code)) is None:
+        if code >= len(self.KEY_TABLE) or (val := self.KEY_TABLE[code]) is None:
             return
         if val == "EMERGENCY":
             self.send(EmergencyStop())
@@ -79,12 +106,14 @@ class PageTurner(EvdevInput):
     Handle button presses from a Bluetooth page turner
     """
     # This has been tested with https://www.amazon.it/dp/B0BPJJTV39
-    KEY_MAP = {
+    KEY_MAP = types.MappingProxyType({
         evdev.ecodes.KEY_UP: "PREVIOUS",
         evdev.ecodes.KEY_DOWN: "NEXT",
         evdev.ecodes.KEY_LEFT: "PREVIOUS",
         evdev.ecodes.KEY_RIGHT: "NEXT",
-    }
+    })
+    # KEY_MAP as a tuple indexed by key code
+    KEY_TABLE = key_table(KEY_MAP)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -95,13 +124,19 @@ class PageTurner(EvdevInput):
         return f"Page Turner {self.device.name}"
 
     async def on_evdev(self, ev: evdev.InputEvent):
+        self._on_key(ev.type, ev.code, ev.value)
+
+    async def on_evdev_raw(self, sec: int, usec: int, type: int, code: int, value: int):
+        self._on_key(type, code, value)
+
+    def _on_key(self, type: int, code: int, value: int) -> None:
         if not self.active:
             return
-        if ev.type != evdev.ecodes.EV_KEY:
+        if type != EV_KEY:
             return
-        if ev.value == 0:
+        if value == 0:
             return
-        if (val := self.KEY_MAP.get(ev.code)) is None:
+        if code >= len(self.KEY_TABLE) or (val := self.KEY_TABLE[code]) is None:
             return
         self.mode(val)
 
@@ -129,97 +164,120 @@ class RingRemote(EvdevInput):
     def description(self) -> str:
         return f"Ring Remote {self.device.name}"
 
-    def _process_event(self, ev: evdev.InputEvent) -> str | str:
-        """
-        Process an event, returning a shortcut name if one triggered
-        """
-        # See /usr/include/linux/input-event-codes.h
+    # Swipe gestures indexed by (x direction + 1) * 3 + y direction + 1.
+    # Horizontal swipes take precedence over vertical ones
+    SWIPES = (
+        "SWIPE LEFT", "SWIPE LEFT", "SWIPE LEFT",
+        "SWIPE UP", None, "SWIPE DOWN",
+        "SWIPE RIGHT", "SWIPE RIGHT", "SWIPE RIGHT",
+    )
+
+    # See /usr/include/linux/input-event-codes.h
+
+    # https://github.com/LinusCDE/rmTabletDriver/blob/master/tabletDriver.py
+    # BTN_TOOL_PEN == 1 means that the pen is hovering over the tablet
+    # BTN_TOUCH == 1 means that the pen is touching the tablet
+
+    # Event handlers take the raw event values, and return a shortcut name if
+    # one triggered
+
+    def _on_touch(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        self.is_down = bool(value)
+        if self.is_down:
+            self.down_first_x = None
+            self.down_first_y = None
+            self.down_last_x = None
+            self.down_last_y = None
+            self.down_time = sec + usec / 1000000
+            return None
+
+        if (first_x := self.down_first_x) is None:
+            dx = None
+        else:
+            dx = self.down_last_x - first_x
+
+        if (first_y := self.down_first_y) is None:
+            dy = None
+        else:
+            dy = self.down_last_y - first_y
+
+        # duration = sec + usec / 1000000 - self.down_time
+
+        if (dx is None or abs(dx) < 30) and (dy is None or abs(dy) < 30):
+            # print("TAP", duration)
+            return "TAP"
+
+        # Direction of the swipe on each axis: -1, 0 or 1
+        cx = 0 if dx is None else (dx > 1000) - (dx < -1000)
+        cy = 0 if dy is None else (dy > 1000) - (dy < -1000)
+        if (gesture := self.SWIPES[(cx + 1) * 3 + cy + 1]) is None:
+            self.logger.warning("Unknown gesture dx=%r dy=%r", dx, dy)
+        return gesture
+
+    def _on_volume_up(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        return "VOLUME UP" if value != 0 else None
+
+    def _on_volume_down(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        return "VOLUME DOWN" if value != 0 else None
+
+    def _on_abs_x(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        if self.down_first_x is None:
+            self.down_first_x = value
+        self.down_last_x = value
+        return None
+
+    def _on_abs_y(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        if self.down_first_y is None:
+            self.down_first_y = value
+        self.down_last_y = value
+        return None
 
-        # https://github.com/LinusCDE/rmTabletDriver/blob/master/tabletDriver.py
-        # BTN_TOOL_PEN == 1 means that the pen is hovering over the tablet
-        # BTN_TOUCH == 1 means that the pen is touching the tablet
+    def _on_ignored(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        return None
 
-        match ev.type:
+    def _on_other(self, sec: int, usec: int, type: int, code: int, value: int) -> str | None:
+        # Unknown events are rare: build an InputEvent to log them readably
+        ev = evdev.InputEvent(sec, usec, type, code, value)
+        match type:
             case evdev.ecodes.EV_KEY:
-                match ev.code:
-                    case evdev.ecodes.BTN_TOUCH:
-                        self.is_down = bool(ev.value)
-                        if self.is_down:
-                            self.down_first_x = None
-                            self.down_first_y = None
-                            self.down_last_x = None
-                            self.down_last_y = None
-                            self.down_time = ev.timestamp()
-                        else:
-                            if self.down_first_x is None:
-                                dx = None
-                            else:
-                                dx = self.down_last_x - self.down_first_x
-
-                            if self.down_first_y is None:
-                                dy = None
-                            else:
-                                dy = self.down_last_y - self.down_first_y
-
-                            # duration = ev.timestamp() - self.down_time
-
-                            if (dx is None or abs(dx) < 30) and (dy is None or abs(dy) < 30):
-                                # print("TAP", duration)
-                                return "TAP"
-                            elif dx is not None and dx < -1000:
-                                # print("SWIPE LEFT", duration)
-                                return "SWIPE LEFT"
-                            elif dx is not None and dx > 1000:
-                                # print("SWIPE RIGHT", duration)
-                                return "SWIPE RIGHT"
-                            elif dy is not None and dy < -1000:
-                                # print("SWIPE UP", duration)
-                                return "SWIPE UP"
-                            elif dy is not None and dy > 1000:
-                                # print("SWIPE DOWN", duration)
-                                return "SWIPE DOWN"
-                            else:
-                                self.logger.warning("Unknown gesture dx=%r dy=%r", dx, dy)
-                    case evdev.ecodes.BTN_TOOL_PEN:
-                        pass
-                    case evdev.ecodes.KEY_VOLUMEUP:
-                        if ev.value != 0:
-                            return "VOLUME UP"
-                    case evdev.ecodes.KEY_VOLUMEDOWN:
-                        if ev.value != 0:
-                            return "VOLUME DOWN"
-                    case _:
-                        self.logger.warning("Unknown KEY event %r", ev)
+                self.logger.warning("Unknown KEY event %r", ev)
             case evdev.ecodes.EV_ABS:
-                match ev.code:
-                    case evdev.ecodes.ABS_X:
-                        if self.down_first_x is None:
-                            self.down_first_x = ev.value
-                        self.down_last_x = ev.value
-                    case evdev.ecodes.ABS_Y:
-                        if self.down_first_y is None:
-                            self.down_first_y = ev.value
-                        self.down_last_y = ev.value
-                    case _:
-                        self.logger.warning("Unknown ABS event %r", ev)
-                        # print("ABS", ev, "::", evdev.categorize(ev))
-            case evdev.ecodes.EV_SYN:
+                self.logger.warning("Unknown ABS event %r", ev)
+                # print("ABS", ev, "::", evdev.categorize(ev))
+            case evdev.ecodes.EV_SYN | evdev.ecodes.EV_MSC:
                 pass
-            case evdev.ecodes.EV_MSC:
-                match ev.code:
-                    case evdev.ecodes.MSC_SCAN:
-                        # print("SCAN", ev.value)
-                        pass
             case _:
                 self.logger.warning("Unknown event %r", ev)
         return None
 
+    # Event handlers indexed by (type << 16) | code
+    EVENT_HANDLERS = {
+        (evdev.ecodes.EV_KEY << 16) | evdev.ecodes.BTN_TOUCH: _on_touch,
+        (evdev.ecodes.EV_KEY << 16) | evdev.ecodes.BTN_TOOL_PEN: _on_ignored,
+        (evdev.ecodes.EV_KEY << 16) | evdev.ecodes.KEY_VOLUMEUP: _on_volume_up,
+        (evdev.ecodes.EV_KEY << 16) | evdev.ecodes.KEY_VOLUMEDOWN: _on_volume_down,
+        (evdev.ecodes.EV_ABS << 16) | evdev.ecodes.ABS_X: _on_abs_x,
+        (evdev.ecodes.EV_ABS << 16) | evdev.ecodes.ABS_Y: _on_abs_y,
+    }
+
     async def on_evdev(self, ev: evdev.InputEvent):
+        await self.on_evdev_batch(((ev.sec, ev.usec, ev.type, ev.code, ev.value),))
+
+    async def on_evdev_batch(self, events: Iterable[tuple[int, int, int, int, int]]):
+        # Dispatch the raw values through the handler table, without building
+        # an InputEvent or awaiting for each event
         if not self.active:
             return
-        if (shortcut := self._process_event(ev)) is None:
-            return
-        self.mode(shortcut)
+        handlers = self.EVENT_HANDLERS
+        on_other = self.__class__._on_other
+        for sec, usec, type, code, value in events:
+            # Synchronization and scan code events are the majority, and are
+            # never interesting
+            if type == EV_SYN or type == EV_MSC:
+                continue
+            handler = handlers.get((type << 16) | code, on_other)
+            if (shortcut := handler(self, sec, usec, type, code, value)) is not None:
+                self.mode(shortcut)
 
     def mode_default(self, value: str):
         self.send(Shortcut(command=value))
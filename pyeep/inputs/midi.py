@@ -12,6 +12,8 @@ from ..messages.component import Shutdown
 
 
 class MidiMessages(Message):
+    __slots__ = ("last_frame_time", "frames", "messages")
+
     def __init__(self, last_frame_time: int, frames: int, messages: list[mido.Message], **kwargs):
         super().__init__(**kwargs)
         self.last_frame_time = last_frame_time
@@ -19,8 +21,8 @@ class MidiMessages(Message):
         self.messages = messages
 
     def __str__(self) -> str:
-        return super().__str__() + (
-                f"(last_frame_time={self.last_frame_time},"
+        return (
+                f"{self.name}(last_frame_time={self.last_frame_time},"
                 f" frames={self.frames},"
                 f" messages={self.messages})")
 
@@ -35,14 +37,24 @@ class MidiInput(JackComponent, AIOComponent):
         self.midi_sinks.append(callback)
 
     def jack_process(self, frames: int):
-        messages: list[mido.Message] = []
+        # Most periods have no MIDI input: only allocate a list when there is
+        # something to put in it
+        messages: list[mido.Message] | None = None
         frame_time = self.jack_client.last_frame_time
         for offset, indata in self.inport.incoming_midi_events():
-            msg = mido.parse([ord(b) for b in indata])
-            msg.time = frame_time + offset
-            messages.append(msg)
+            # JACK delivers one complete message per event: decode it
+            # directly instead of going through a mido.Parser for each one
+            try:
+                msg = mido.Message.from_bytes(bytes(indata), time=frame_time + offset)
+            except ValueError:
+                # Skip malformed events
+                continue
+            if messages is None:
+                messages = [msg]
+            else:
+                messages.append(msg)
 
-        if not messages:
+        if messages is None:
             return
 
         msg = MidiMessages(last_frame_time=frame_time, frames=frames, messages=messages)
@@ -52,7 +64,7 @@ class MidiInput(JackComponent, AIOComponent):
         for cb in self.midi_sinks:
             cb(msg)
 
-        self.hub.loop.call_soon_threadsafe(self.send, msg)
+        self.hub.post_rt(self.send, msg)
 
     async def run(self) -> None:
         while True:
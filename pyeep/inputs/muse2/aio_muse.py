@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import functools
+import asyncio
+import logging
 import time
 
 import bleak
 import muselsl.constants
 import muselsl.muse
 
+log = logging.getLogger(__name__)
+
 
 class Muse(muselsl.muse.Muse):
     """
@@ -19,6 +22,9 @@ class Muse(muselsl.muse.Muse):
     # a simplified way, since we can make more assumptions about bleak and
     # asyncio
 
+    # Cache of command strings encoded for _write_cmd_str
+    encoded_commands: dict[str, bytes] = {}
+
     def __init__(self, client: bleak.BleakClient):
         self.client = client
         self.callback_eeg = None
@@ -30,21 +36,25 @@ class Muse(muselsl.muse.Muse):
         self.time_func = time.time
         self.last_timestamp = self.time_func()
 
-    async def _write_cmd(self, cmd: list[bytes]):
+    async def _write_cmd(self, cmd: bytes | list[int]):
         """
         Write a command to the Muse device
         """
+        # bytes() returns bytes arguments as they are, without copying
         await self.client.write_gatt_char(
                 0x000e - 1,
-                bytearray(cmd),
+                bytes(cmd),
                 False)
 
     async def _write_cmd_str(self, cmd: str):
         """
         Encode and write a command string to the Muse device
         """
-        await self._write_cmd(
-                [len(cmd) + 1, *(ord(char) for char in cmd), ord('\n')])
+        # The same few commands are sent over and over: encode each only once
+        if (payload := self.encoded_commands.get(cmd)) is None:
+            payload = self.encoded_commands[cmd] = bytes(
+                    [len(cmd) + 1, *(ord(char) for char in cmd), ord('\n')])
+        await self._write_cmd(payload)
 
     async def ask_control(self):
         """Send a message to Muse to ask for the control status.
@@ -117,30 +127,33 @@ class Muse(muselsl.muse.Muse):
           'p22','p23','p31','p32','p50','p51','p52','p53','p60','p61','p63','pAB','pAD'
         Default is 'p21'."""
 
-        if type(preset) is int:
-            preset = str(preset)
-        if preset[0] == 'p':
-            preset = preset[1:]
-        if str(preset) != '21':
-            print('Sending command for non-default preset: p' + preset)
-        preset = bytes(preset, 'utf-8')
-        await self._write_cmd([0x04, 0x70, *preset, 0x0a])
+        if isinstance(preset, bytes):
+            preset = preset.decode()
+        if preset == 21 or preset == "p21" or preset == "21":
+            # Fast path for the default preset
+            await self._write_cmd_str("p21")
+            return
+        preset = str(preset)
+        if preset[0] != 'p':
+            preset = "p" + preset
+        log.info("Sending command for non-default preset: %s", preset)
+        await self._write_cmd_str(preset)
 
     async def _start_notify(self, uuid, callback):
-        @functools.wraps(callback)
         def wrap(gatt_characteristic, data):
-            value_handle = gatt_characteristic.handle + 1
-            callback(value_handle, data)
+            callback(gatt_characteristic.handle + 1, data)
         await self.client.start_notify(uuid, wrap)
 
     async def subscribe_eeg(self, callback_eeg):
         """subscribe to eeg stream."""
         self.callback_eeg = callback_eeg
-        await self._start_notify(muselsl.constants.MUSE_GATT_ATTR_TP9, callback=self._handle_eeg)
-        await self._start_notify(muselsl.constants.MUSE_GATT_ATTR_AF7, callback=self._handle_eeg)
-        await self._start_notify(muselsl.constants.MUSE_GATT_ATTR_AF8, callback=self._handle_eeg)
-        await self._start_notify(muselsl.constants.MUSE_GATT_ATTR_TP10, callback=self._handle_eeg)
-        await self._start_notify(muselsl.constants.MUSE_GATT_ATTR_RIGHTAUX, callback=self._handle_eeg)
+        # Subscribe concurrently, to overlap the BLE round trips
+        await asyncio.gather(
+            self._start_notify(muselsl.constants.MUSE_GATT_ATTR_TP9, callback=self._handle_eeg),
+            self._start_notify(muselsl.constants.MUSE_GATT_ATTR_AF7, callback=self._handle_eeg),
+            self._start_notify(muselsl.constants.MUSE_GATT_ATTR_AF8, callback=self._handle_eeg),
+            self._start_notify(muselsl.constants.MUSE_GATT_ATTR_TP10, callback=self._handle_eeg),
+            self._start_notify(muselsl.constants.MUSE_GATT_ATTR_RIGHTAUX, callback=self._handle_eeg))
 
     async def subscribe_control(self, callback_control):
         self.callback_control = callback_control
@@ -168,12 +181,10 @@ class Muse(muselsl.muse.Muse):
         self.callback_ppg = callback_ppg
         try:
             """subscribe to ppg stream."""
-            await self._start_notify(
-                muselsl.contants.MUSE_GATT_ATTR_PPG1, callback=self._handle_ppg)
-            await self._start_notify(
-                muselsl.contants.MUSE_GATT_ATTR_PPG2, callback=self._handle_ppg)
-            await self._start_notify(
-                muselsl.contants.MUSE_GATT_ATTR_PPG3, callback=self._handle_ppg)
+            await asyncio.gather(
+                self._start_notify(muselsl.constants.MUSE_GATT_ATTR_PPG1, callback=self._handle_ppg),
+                self._start_notify(muselsl.constants.MUSE_GATT_ATTR_PPG2, callback=self._handle_ppg),
+                self._start_notify(muselsl.constants.MUSE_GATT_ATTR_PPG3, callback=self._handle_ppg))
         except Exception:
             raise Exception(
                 'PPG data is not available on this device. PPG is only available on Muse 2'
@@ -1,13 +1,24 @@
 #!/usr/bin/python3
 
+from __future__ import annotations
+
+import array
+import bisect
+import logging
+import struct
 import threading
-from typing import Generator, Optional, Self
+from typing import TYPE_CHECKING, Generator, Iterable, Optional, Self
 
 import jack
-import mido
 
-from .deltalist import DeltaList, Event
-from .jack import JackComponent
+from .deltalist import Event
+from .component.jack import JackComponent
+from .midi import encode_message, frame_delay, read_ring_records
+
+if TYPE_CHECKING:
+    # mido is imported only when messages need to be decoded or encoded with
+    # it, which the common paths avoid
+    import mido
 
 # See:
 # https://github.com/jackaudio/jackaudio.github.com/wiki/WalkThrough_Dev_LatencyBufferProcess
@@ -25,11 +36,26 @@ from .jack import JackComponent
 # https://en.wikipedia.org/wiki/General_MIDI
 # https://github.com/harryhaaren/JACK-MIDI-Examples
 
+log = logging.getLogger(__name__)
+
+
+def mlock_ring(ring: jack.RingBuffer) -> None:
+    """
+    Try to lock a ring buffer in memory, to keep it from being paged out
+    """
+    # This is best-effort: it fails with a normal RLIMIT_MEMLOCK
+    try:
+        ring.mlock()
+    except jack.JackError as e:
+        log.warning("cannot lock MIDI ring buffer in memory: %s", e)
+
 
 class MidiEvent(Event):
     """
     Frame-timed event carrying a MIDI message
     """
+    __slots__ = ("_msg", "_data")
+
     def __init__(
             self, *,
             msg: Optional[mido.Message] = None,
@@ -58,7 +84,8 @@ class MidiEvent(Event):
     @property
     def msg(self) -> mido.Message:
         if self._msg is None:
-            self._msg = mido.parse([ord(b) for b in self.data])
+            import mido
+            self._msg = mido.Message.from_bytes(self.data)
         return self._msg
 
     @property
@@ -78,42 +105,145 @@ class MidiPlayer(JackComponent):
     """
     JACK client that plays a queue of MIDI events
     """
-    def __init__(self, client: jack.Client):
-        super().__init__(client)
-        self.events = DeltaList[MidiEvent]()
-        self.events_mutex = threading.Lock()
-        self.midi_outport = self.client.midi_outports.register('midi output')
+    # Header of each event record in the ring buffer: frame delay and length
+    # of the encoded MIDI message that follows
+    RECORD_HEADER = struct.Struct("<IH")
+    # Size in bytes of the ring buffer used to pass events to the realtime
+    # thread
+    ring_size = 1 << 16
 
-    def play(self, type: str, *, delay_sec: float = 0.0, **args):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Events are passed to the realtime thread through a lock-free ring
+        # buffer. Only the realtime thread touches the queue of pending events
+        self.ring = jack.RingBuffer(self.ring_size)
+        mlock_ring(self.ring)
+        # The ring buffer supports a single writer: serialize producers
+        self.ring_lock = threading.Lock()
+        # Frame count at the start of the current period
+        self.clock: int = 0
+        # Pending events, as sorted absolute frames and their encoded MIDI
+        # messages. The queue is usually short, so bisecting and shifting
+        # arrays in C is cheaper than a heap of Python objects
+        self.deadlines = array.array("Q")
+        self.payloads: list[bytes] = []
+        self.samplerate: int
+
+    def set_jack_client(self, jack_client: jack.Client):
+        super().set_jack_client(jack_client)
+        self.samplerate = jack_client.samplerate
+        self.midi_outport = self.jack_client.midi_outports.register('midi output')
+
+    def _encode_record(self, delay_sec: float, data: bytes) -> bytes:
         """
-        Enqueue a MIDI event to be played
+        Encode a ring buffer record for a MIDI message
         """
-        msg = mido.Message(type, **args)
-        evt = MidiEvent.from_msg(msg, encode=True, frame_delay=int(round(delay_sec * self.samplerate)))
-        with self.events_mutex:
-            self.events.add_event(evt)
+        return self.RECORD_HEADER.pack(frame_delay(delay_sec, self.samplerate), len(data)) + data
 
-    def on_process(self, frames: int):
-        self.midi_outport.clear_buffer()
+    def _write_records(self, records: bytes) -> None:
+        """
+        Write encoded records to the ring buffer
+        """
+        with self.ring_lock:
+            if self.ring.write_space < len(records):
+                log.warning("MIDI event queue is full: dropping %d bytes of events", len(records))
+                return
+            self.ring.write(records)
 
-        with self.events_mutex:
-            events = self.events.clock_tick(frames)
+    def play(self, type: str, *, delay_sec: float = 0.0, **args):
+        """
+        Enqueue a MIDI event to be played
+        """
+        data = encode_message(type, **args)
+        self._write_records(self._encode_record(delay_sec, data))
 
-        for evt in events:
-            self.midi_outport.write_midi_event(evt.frame_delay, evt.data)
+    def play_batch(self, events: Iterable[tuple[float, bytes]]):
+        """
+        Enqueue several already encoded MIDI messages, each with its delay in
+        seconds
+        """
+        self._write_records(b"".join(
+            self._encode_record(delay_sec, data) for delay_sec, data in events))
+
+    def jack_process(self, frames: int):
+        port = self.midi_outport
+        port.clear_buffer()
+
+        # Move newly enqueued events to the pending queue. Events on the same
+        # frame stay in the order they were enqueued
+        clock = self.clock
+        deadlines = self.deadlines
+        payloads = self.payloads
+        for delay, data in read_ring_records(self.ring, self.RECORD_HEADER):
+            deadline = clock + delay
+            pos = bisect.bisect_right(deadlines, deadline)
+            deadlines.insert(pos, deadline)
+            payloads.insert(pos, data)
+
+        end = clock + frames
+        self.clock = end
+
+        # Most periods have nothing to play
+        if not deadlines or deadlines[0] >= end:
+            return
+
+        due = bisect.bisect_left(deadlines, end)
+        write = port.write_midi_event
+        try:
+            for pos in range(due):
+                write(deadlines[pos] - clock, payloads[pos])
+        except jack.JackError:
+            # The port buffer is full: drop the rest of the events due in
+            # this period
+            pass
+        del deadlines[:due]
+        del payloads[:due]
 
 
 class MidiReceiver(JackComponent):
     """
     JACK client that receives MIDI events
     """
+    # Header of each event record in the ring buffer: frame time and length
+    # of the encoded MIDI message that follows
+    RECORD_HEADER = struct.Struct("<QH")
+    # Size in bytes of the ring buffer used to pass events from the realtime
+    # thread
+    ring_size = 1 << 16
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # The realtime thread only copies raw events to the ring buffer:
+        # decoding happens in read_events
+        self.ring = jack.RingBuffer(self.ring_size)
+        mlock_ring(self.ring)
+
+    def set_jack_client(self, jack_client: jack.Client):
+        super().set_jack_client(jack_client)
         self.inport = self.jack_client.midi_inports.register('midi input')
 
-    def read_events(self) -> Generator[MidiEvent, None, None]:
+    def jack_process(self, frames: int):
         frame_time = self.jack_client.last_frame_time
+        ring = self.ring
+        header = self.RECORD_HEADER
         for offset, indata in self.inport.incoming_midi_events():
-            msg = mido.parse([ord(b) for b in indata])
-            msg.time = frame_time + offset
+            record = header.pack(frame_time + offset, len(indata)) + bytes(indata)
+            # If the reader does not keep up, drop events rather than block
+            if ring.write_space >= len(record):
+                ring.write(record)
+
+    def read_events(self) -> Generator[mido.Message, None, None]:
+        """
+        Decode the events received so far.
+
+        This is meant to be called outside of the realtime thread
+        """
+        import mido
+        for frame_time, data in read_ring_records(self.ring, self.RECORD_HEADER):
+            try:
+                msg = mido.Message.from_bytes(data, time=frame_time)
+            except ValueError as e:
+                # Skip malformed events
+                log.debug("skipping malformed MIDI event %r: %s", data, e)
+                continue
             yield msg
@@ -2,14 +2,26 @@ from __future__ import annotations
 
 import threading
 
+import numpy
 import pylsl
 
-from .app import Message
-from .aio import AIOComponent
+from .component.aio import AIOComponent
+from .messages.message import Message
+
+# numpy types for the LSL channel formats that can be pulled into arrays
+CHANNEL_DTYPES = {
+    pylsl.cf_float32: numpy.float32,
+    pylsl.cf_double64: numpy.float64,
+    pylsl.cf_int32: numpy.int32,
+    pylsl.cf_int16: numpy.int16,
+    pylsl.cf_int8: numpy.int8,
+}
 
 
 class LSLSamples(Message):
-    def __init__(self, samples: list, timestamps: list):
+    __slots__ = ("samples", "timestamps")
+
+    def __init__(self, samples: numpy.ndarray | list, timestamps: numpy.ndarray | list):
         super().__init__()
         self.samples = samples
         self.timestamps = timestamps
@@ -47,12 +59,28 @@ class LSLComponent(AIOComponent):
         self.inlet = pylsl.StreamInlet(self.stream_info)
         self.logger.info("connected to stream inlet")
 
+        # For numeric streams, have liblsl write samples into a preallocated
+        # array instead of building a list of lists
+        if (dtype := CHANNEL_DTYPES.get(self.stream_info.channel_format())) is not None:
+            buf = numpy.empty((self.max_samples, self.stream_info.channel_count()), dtype=dtype)
+        else:
+            buf = None
+
         while not self.thread_stop:
-            samples, timestamps = self.inlet.pull_chunk(timeout=0.2, max_samples=self.max_samples)
-            if not samples:
-                continue
+            if buf is None:
+                samples, timestamps = self.inlet.pull_chunk(timeout=0.2, max_samples=self.max_samples)
+                if not samples:
+                    continue
+            else:
+                samples, timestamps = self.inlet.pull_chunk(
+                        timeout=0.2, max_samples=self.max_samples, dest_obj=buf)
+                if not len(timestamps):
+                    continue
+                samples = buf[:len(timestamps)].copy()
+                timestamps = numpy.asarray(timestamps)
             if not self.hub.loop:
                 continue
-            self.hub.loop.call_soon_threadsafe(self.receive, LSLSamples(samples=samples, timestamps=timestamps))
+            # Bursts of chunks are delivered with a single event loop wakeup
+            self.hub.post_rt(self.receive, LSLSamples(samples=samples, timestamps=timestamps))
 
         # self.inlet.close_stream()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from .message import Message
 
@@ -12,47 +11,45 @@ class Shutdown(Message):
     """
     Message sent to initiate component shutdown
     """
-    pass
+    __slots__ = ()
 
 
 class NewComponent(Message):
     """
     Notify that a new component has been added
     """
+    __slots__ = ()
+
     def __str__(self) -> str:
-        return super().__str__() + f"(component={self.src})"
+        return f"{self.name}(component={self.src})"
 
 
 class ComponentActiveStateChanged(Message):
     """
     Notify a change of active state for an input
     """
+    __slots__ = ("value",)
+    jsonable_fields = ("value",)
+
     def __init__(self, *, value: bool, **kwargs):
         super().__init__(**kwargs)
         self.value = value
 
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["value"] = self.value
-        return res
-
     def __str__(self) -> str:
-        return super().__str__() + f"(value={self.value})"
+        return f"{self.name}(value={self.value})"
 
 
 class DeviceScanRequest(Message):
     """
     Request to scan for new devices
     """
+    __slots__ = ("duration",)
+    jsonable_fields = ("duration",)
+
     def __init__(self, *, duration: float, **kwargs):
         super().__init__(**kwargs)
         # Duration in seconds of the scan
         self.duration = duration
 
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["duration"] = self.duration
-        return res
-
     def __str__(self):
-        return super().__str__() + f"(duration={self.duration})"
+        return f"{self.name}(duration={self.duration})"
@@ -11,21 +11,19 @@ class ConfigSaveRequest(Message):
     """
     Message sent to initiate saving configuration
     """
-    pass
+    __slots__ = ()
 
 
 class Configure(Message):
     """
     Message sent to a component to restore its configuration
     """
+    __slots__ = ("config",)
+    jsonable_fields = ("config",)
+
     def __init__(self, *, config: dict[str, Any], **kwargs):
         super().__init__(**kwargs)
         self.config = config
 
     def __str__(self):
-        return super().__str__() + f"(config={self.config!r})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["config"] = self.config
-        return res
+        return f"{self.name}(config={self.config!r})"
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from .message import Message
 
@@ -12,55 +11,49 @@ class EmergencyStop(Message):
     """
     Request to stop any activity as soon as possible
     """
-    pass
+    __slots__ = ()
 
 
 class Shortcut(Message):
     """
     Event notifying the trigger of a named keyboard shortcut
     """
+    __slots__ = ("command",)
+    jsonable_fields = ("command",)
+
     def __init__(self, *, command: str, **kwargs):
         super().__init__(**kwargs)
         self.command = command
 
     def __str__(self):
-        return super().__str__() + f"(command={self.command})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["command"] = self.command
-        return res
+        return f"{self.name}(command={self.command})"
 
 
 class Pause(Message):
     """
     Pause outputs in a group
     """
+    __slots__ = ("group",)
+    jsonable_fields = ("group",)
+
     def __init__(self, *, group: int, **kwargs):
         super().__init__(**kwargs)
         self.group = group
 
     def __str__(self) -> str:
-        return super().__str__() + f"(group={self.group})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["group"] = self.group
-        return res
+        return f"{self.name}(group={self.group})"
 
 
 class Resume(Message):
     """
     Unpause outputs in a group
     """
+    __slots__ = ("group",)
+    jsonable_fields = ("group",)
+
     def __init__(self, *, group: int, **kwargs):
         super().__init__(**kwargs)
         self.group = group
 
     def __str__(self) -> str:
-        return super().__str__() + f"(group={self.group})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["group"] = self.group
-        return res
+        return f"{self.name}(group={self.group})"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import logging
 from typing import Any, Type
@@ -7,7 +8,32 @@ from typing import Any, Type
 log = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _resolve_class(module_name: str, class_name: str) -> Type[Jsonable] | None:
+    """
+    Look up a class by module and class name.
+
+    Results are cached, including failures, so that a stream of messages of
+    an unknown type does not retry the import for each message
+    """
+    try:
+        mod = importlib.import_module(module_name)
+        return getattr(mod, class_name)
+    except Exception as e:
+        log.error("cannot find module class %s.%s: %s", module_name, class_name, e)
+        return None
+
+
 class Jsonable:
+    __slots__ = ()
+
+    # Jsonable classes indexed by module and class name
+    registry: dict[tuple[str, str], Type[Jsonable]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Jsonable.registry[(cls.__module__, cls.__name__)] = cls
+
     def as_jsonable(self) -> dict[str, Any]:
         return {
             "__module__": self.__class__.__module__,
@@ -23,9 +49,8 @@ class Jsonable:
             log.error("message malformed: %r: %s", jsonable, e)
             return None
 
-        try:
-            mod = importlib.import_module(module_name)
-            return getattr(mod, class_name)
-        except Exception as e:
-            log.error("cannot find module class %s.%s: %s", module_name, class_name, e)
-            return None
+        if (cls := Jsonable.registry.get((module_name, class_name))) is not None:
+            return cls
+
+        # Fall back to importing classes whose modules are not loaded yet
+        return _resolve_class(module_name, class_name)
@@ -16,6 +16,26 @@ class Message(Jsonable):
     """
     Base class for messages sent between components
     """
+    __slots__ = ("ts", "src", "dst", "name")
+
+    # Name given to messages of this class when not set explicitly
+    default_name: str = "message"
+    # Attributes serialized as they are by as_jsonable, besides those of
+    # Message. Subclasses only list their own: the fields of base classes are
+    # added when the class is created
+    jsonable_fields: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "default_name" not in cls.__dict__:
+            cls.default_name = cls.__name__.lower()
+        fields: list[str] = []
+        for base in reversed(cls.__mro__):
+            for name in base.__dict__.get("jsonable_fields", ()):
+                if name not in fields:
+                    fields.append(name)
+        cls.jsonable_fields = tuple(fields)
+
     def __init__(
             self, *,
             ts: float | None = None,
@@ -25,18 +45,24 @@ class Message(Jsonable):
         self.ts = ts if ts is not None else time.time()
         self.src = src
         self.dst = dst
-        if name is None:
-            self.name = self.__class__.__name__.lower()
-        else:
-            self.name = name
+        self.name = name if name is not None else self.default_name
 
     def __str__(self) -> str:
         return self.name
 
     def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["ts"] = self.ts
-        res["src"] = self.src.name if self.src else None
-        res["dst"] = self.dst
-        res["name"] = self.name
+        # Build the common fields in a single dict display, instead of
+        # extending the dict from Jsonable.as_jsonable
+        cls = self.__class__
+        src = self.src
+        res = {
+            "__module__": cls.__module__,
+            "__class__": cls.__name__,
+            "ts": self.ts,
+            "src": src.name if src else None,
+            "dst": self.dst,
+            "name": self.name,
+        }
+        for name in self.jsonable_fields:
+            res[name] = getattr(self, name)
         return res
@@ -18,17 +18,15 @@ class SetRate(Message):
     This is mainly used to for communication between a PowerOutputBottom and a
     PowerOutputTop
     """
+    __slots__ = ("rate",)
+    jsonable_fields = ("rate",)
+
     def __init__(self, *, rate: float, **kwargs):
         super().__init__(**kwargs)
         self.rate = rate
 
     def __str__(self) -> str:
-        return super().__str__() + f"(rate={self.rate})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["rate"] = self.rate
-        return res
+        return f"{self.name}(rate={self.rate})"
 
 
 class SetPower(Message):
@@ -38,30 +36,30 @@ class SetPower(Message):
     This is mainly used to send power commands from a PowerOutputTop to a
     PowerOutputBottom
     """
+    __slots__ = ("power",)
+    jsonable_fields = ("power",)
+
     def __init__(self, *, power: float, **kwargs):
         super().__init__(**kwargs)
         self.power = power
 
     def __str__(self) -> str:
-        return super().__str__() + f"(power={self.power})"
-
-    def as_jsonable(self) -> dict[str, Any]:
-        res = super().as_jsonable()
-        res["power"] = self.power
-        return res
+        return f"{self.name}(power={self.power})"
 
 
 class SetGroupPower(Message):
     """
     Set the power of the outputs in the given group
     """
+    __slots__ = ("group", "power")
+
     def __init__(self, *, group: int, power: float | PowerAnimation, **kwargs):
         super().__init__(**kwargs)
         self.group = group
         self.power = power
 
     def __str__(self) -> str:
-        return super().__str__() + f"(group={self.group}, power={self.power})"
+        return f"{self.name}(group={self.group}, power={self.power})"
 
     def as_jsonable(self) -> dict[str, Any]:
         res = super().as_jsonable()
@@ -74,13 +72,15 @@ class IncreaseGroupPower(Message):
     """
     Increase the power of an output group by a given amount
     """
+    __slots__ = ("group", "amount")
+
     def __init__(self, *, group: int, amount: float | PowerAnimation, **kwargs):
         super().__init__(**kwargs)
         self.group = group
         self.amount = amount
 
     def __str__(self) -> str:
-        return super().__str__() + f"(group={self.group}, amount={self.amount})"
+        return f"{self.name}(group={self.group}, amount={self.amount})"
 
     def as_jsonable(self) -> dict[str, Any]:
         res = super().as_jsonable()
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    import jack
+
+# MIDI status bytes
+NOTE_OFF = 0x80
+NOTE_ON = 0x90
+POLYTOUCH = 0xA0
+CONTROL_CHANGE = 0xB0
+PROGRAM_CHANGE = 0xC0
+AFTERTOUCH = 0xD0
+PITCHWHEEL = 0xE0
+
+# Channel voice messages encoded without going through mido: status byte and
+# data arguments with their defaults, in encoding order
+CHANNEL_MESSAGES: dict[str, tuple[int, tuple[tuple[str, int], ...]]] = {
+    "note_off": (NOTE_OFF, (("note", 0), ("velocity", 64))),
+    "note_on": (NOTE_ON, (("note", 0), ("velocity", 64))),
+    "polytouch": (POLYTOUCH, (("note", 0), ("value", 0))),
+    "control_change": (CONTROL_CHANGE, (("control", 0), ("value", 0))),
+    "program_change": (PROGRAM_CHANGE, (("program", 0),)),
+    "aftertouch": (AFTERTOUCH, (("value", 0),)),
+    "pitchwheel": (PITCHWHEEL, (("pitch", 0),)),
+}
+
+
+def _check_int(name: str, value: Any, min: int, max: int) -> None:
+    """
+    Validate a message argument, raising the same errors as mido.Message
+    """
+    if not isinstance(value, int):
+        raise TypeError(f"{name} must be int")
+    if not min <= value <= max:
+        raise ValueError(f"{name} must be in range {min}..{max}")
+
+
+def encode_message(type: str, **args) -> bytes:
+    """
+    Encode a MIDI message to bytes.
+
+    Arguments are validated as mido.Message does, but channel voice messages
+    are encoded directly, without building a mido.Message
+    """
+    if (spec := CHANNEL_MESSAGES.get(type)) is None:
+        import mido
+        return bytes(mido.Message(type, **args).bin())
+
+    status, fields = spec
+    channel = args.pop("channel", 0)
+    _check_int("channel", channel, 0, 15)
+    # Accepted for compatibility with mido.Message, but not encoded
+    args.pop("time", None)
+
+    if status == PITCHWHEEL:
+        pitch = args.pop("pitch", 0)
+        _check_int("pitch", pitch, -8192, 8191)
+        pitch += 8192
+        data = bytes((status | channel, pitch & 0x7f, pitch >> 7))
+    else:
+        values = [status | channel]
+        for name, default in fields:
+            value = args.pop(name, default)
+            _check_int("data byte", value, 0, 127)
+            values.append(value)
+        data = bytes(values)
+
+    if args:
+        raise ValueError(f"{type} message has no attribute {next(iter(args))}")
+
+    return data
+
+
+def frame_delay(delay_sec: float, samplerate: int) -> int:
+    """
+    Convert a delay in seconds to a number of frames.
+
+    Negative delays are for events that are already late, and give 0 to
+    play them immediately
+    """
+    # Most events are played immediately
+    if delay_sec <= 0:
+        return 0
+    # The delay is positive, so rounding is adding 0.5 and truncating
+    return int(delay_sec * samplerate + 0.5)
+
+
+def read_ring_records(ring: jack.RingBuffer, header: struct.Struct) -> Iterator[tuple[int, bytes]]:
+    """
+    Read complete records from a JACK ring buffer, as (time, data) tuples.
+
+    Each record is a header with a time and the size of the data that follows.
+    A write that wraps around the end of the ring buffer becomes readable in
+    two steps: records that are not completely readable yet are left in the
+    ring buffer for the next call
+    """
+    header_size = header.size
+    while (space := ring.read_space) >= header_size:
+        time, size = header.unpack(ring.peek(header_size))
+        if space < header_size + size:
+            break
+        ring.read_advance(header_size)
+        yield time, bytes(ring.read(size))
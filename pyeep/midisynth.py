@@ -4,16 +4,22 @@ import logging
 import math
 import threading
 from collections import deque
-from typing import NamedTuple, Sequence, Type
+from typing import TYPE_CHECKING, NamedTuple, Sequence, Type
 
-import mido
 import numpy
 
 from .synth import EnvelopeShape, Envelope, SineWave, SawWave
 
+if TYPE_CHECKING:
+    import mido
+
 log = logging.getLogger(__name__)
 
 
+# Frequency of each MIDI note, without pitch bend
+NOTE_FREQS: tuple[float, ...] = tuple(440.0 * math.exp2((note - 69) / 12) for note in range(128))
+
+
 class AudioConfig(NamedTuple):
     in_samplerate: int
     out_samplerate: int
@@ -36,6 +42,8 @@ class Note:
             return self.note - 69
 
     def get_freq(self) -> float:
+        if self.last_pitchwheel is None:
+            return NOTE_FREQS[self.note]
         return 440.0 * math.exp2(self.get_semitone() / 12)
 
     def add_event(self, msg: mido.Message):
@@ -13,13 +13,15 @@ class SetGroupColor(Message):
     """
     Set the power of the outputs in the given group
     """
+    __slots__ = ("group", "color")
+
     def __init__(self, *, group: int, color: Color | ColorAnimation, **kwargs):
         super().__init__(**kwargs)
         self.group = group
         self.color = color
 
     def __str__(self) -> str:
-        return super().__str__() + f"(group={self.group}, color={self.color}"
+        return f"{self.name}(group={self.group}, color={self.color})"
 
 
 class ColorOutput(Output):
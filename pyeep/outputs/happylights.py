@@ -18,15 +18,14 @@ class SetColor(Message):
     """
     Internal use only
     """
+    __slots__ = ("color",)
+
     def __init__(self, color: Color, **kwargs):
         super().__init__(**kwargs)
         self.color = color
 
     def __str__(self) -> str:
-        return (
-            super().__str__() +
-            f"(color={self.color})"
-        )
+        return f"{self.name}(color={self.color})"
 
 
 class HappyLights(ColorOutput, bluetooth.BluetoothComponent):
@@ -186,9 +186,9 @@ class Envelope:
             if chunk is None:
                 if not has_data:
                     return None
-                chunk = numpy.zeros(frames - start)
-            else:
-                has_data = True
+                # Silence after release: the rest of res is already zeroed
+                break
+            has_data = True
             res[start:start+len(chunk)] = chunk
             start += len(chunk)
 
@@ -6,8 +6,11 @@ setup(
     name="pyeep",
     python_requires=">= 3.11",
     install_requires=[
-        'pyaudio', 'numpy',
+        'pyaudio', 'numpy', 'JACK-Client',
     ],
+    extras_require={
+        'midi': ['mido'],
+    },
     version="0.1",
     description="Simple Python synth and audio pattern generator",
     author="Enrico Zini",
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+import unittest
+
+from pyeep.component.aio import AIOComponent
+from pyeep.messages.component import Shutdown
+from pyeep.messages.message import Message
+
+
+class MockHub:
+    def _running_in_hub(self):
+        return True
+
+
+class TestAIOComponent(unittest.IsolatedAsyncioTestCase):
+    async def test_next_message(self):
+        comp = AIOComponent(hub=MockHub())
+        m1 = Message()
+        m2 = Shutdown()
+        comp.receive(m1)
+        comp.receive(m2)
+        self.assertIs(await comp.next_message(), m1)
+        self.assertIs(await comp.next_message(), m2)
+        self.assertIsNone(await comp.next_message(timeout=0.01))
+
+    async def test_wakeup(self):
+        comp = AIOComponent(hub=MockHub())
+        msg = Message()
+        task = asyncio.create_task(comp.next_message())
+        await asyncio.sleep(0)
+        self.assertFalse(task.done())
+        comp.receive(msg)
+        self.assertIs(await task, msg)
+
+    async def test_next_messages(self):
+        comp = AIOComponent(hub=MockHub())
+        msgs = [Message(), Message(), Message()]
+        for msg in msgs:
+            comp.receive(msg)
+        self.assertEqual(comp.next_messages(), msgs)
+        self.assertEqual(comp.next_messages(), [])
+
+    async def test_timeout_deadline(self):
+        comp = AIOComponent(hub=MockHub())
+        loop = asyncio.get_running_loop()
+
+        async def wake_up():
+            # Wake up the consumer without leaving messages in the queue
+            while True:
+                await asyncio.sleep(0.01)
+                comp.message_event.set()
+
+        waker = asyncio.create_task(wake_up())
+        try:
+            start = loop.time()
+            self.assertIsNone(await asyncio.wait_for(comp.next_message(timeout=0.05), timeout=1))
+            self.assertLess(loop.time() - start, 0.5)
+        finally:
+            waker.cancel()
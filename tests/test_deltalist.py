@@ -70,3 +70,18 @@ class TestDeltaList(unittest.TestCase):
                 [(evt.name, evt.frame_delay) for evt in dl.clock_tick(1000)],
                 [("third", 650),
                  ("fourth", 850)])
+
+    def test_events_readonly(self):
+        dl = DeltaList()
+
+        first = TestEvent("first", frame_delay=10)
+        second = TestEvent("second", frame_delay=100)
+        dl.add_event(first)
+        dl.add_event(second)
+
+        self.assertEqual([evt.frame_delay for evt in dl.events], [10, 90])
+        self.assertEqual(second.frame_delay, 100)
+
+        self.assertEqual(
+                [(evt.name, evt.frame_delay) for evt in dl.clock_tick(200)],
+                [("first", 10), ("second", 100)])
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy
+import scipy.signal
+
+from pyeep.dsp import Butterworth, ButterworthBank
+
+
+class TestButterworth(unittest.TestCase):
+    def reference(self, filter: Butterworth, samples: numpy.ndarray) -> numpy.ndarray:
+        zi = scipy.signal.sosfilt_zi(filter.sos) * samples[0]
+        return scipy.signal.sosfilt(filter.sos, samples, zi=zi)[0]
+
+    def test_sample(self):
+        samples = numpy.sin(numpy.linspace(0, 20, 200)) + numpy.linspace(0, 1, 200)
+        f = Butterworth(100, 5)
+        filtered = numpy.array([f(s) for s in samples])
+        numpy.testing.assert_allclose(filtered, self.reference(f, samples))
+
+    def test_block(self):
+        samples = numpy.sin(numpy.linspace(0, 20, 200)) + numpy.linspace(0, 1, 200)
+        f = Butterworth(100, (5, 20), btype="band")
+        filtered = numpy.concatenate((
+            f.process(samples[:64]),
+            [f(s) for s in samples[64:70]],
+            f.process(samples[70:])))
+        numpy.testing.assert_allclose(filtered, self.reference(f, samples))
+
+    def test_bank(self):
+        samples = numpy.sin(numpy.linspace(0, 20, 200)) + numpy.linspace(0, 1, 200)
+        bank = ButterworthBank()
+        low = bank.add(100, 5)
+        high = bank.add(100, 20, btype="high", order=5)
+        filtered_low = []
+        filtered_high = []
+        for s in samples:
+            filtered_low.append(low(s))
+            filtered_high.append(high(s))
+        numpy.testing.assert_allclose(filtered_low, self.reference(low, samples))
+        numpy.testing.assert_allclose(filtered_high, self.reference(high, samples))
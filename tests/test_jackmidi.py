@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import unittest
+
+try:
+    import jack
+    HAVE_JACK = True
+except (ModuleNotFoundError, OSError):
+    # JACK-Client raises OSError if libjack is not installed
+    HAVE_JACK = False
+
+if HAVE_JACK:
+    from pyeep.jackmidi import MidiPlayer, MidiReceiver
+
+
+class MockHub:
+    def _running_in_hub(self):
+        return True
+
+
+class MockOutPort:
+    """
+    Model of a JACK MIDI output port, recording the events written in the
+    current period
+    """
+    def __init__(self, capacity: int = 16):
+        self.capacity = capacity
+        self.events: list[tuple[int, bytes]] = []
+
+    def clear_buffer(self) -> None:
+        self.events = []
+
+    def write_midi_event(self, time: int, data: bytes) -> None:
+        if len(self.events) >= self.capacity:
+            raise jack.JackError("MIDI buffer full")
+        self.events.append((time, bytes(data)))
+
+
+class MockInPort:
+    """
+    Model of a JACK MIDI input port, returning the events queued for the
+    current period
+    """
+    def __init__(self):
+        self.events: list[tuple[int, bytes]] = []
+
+    def incoming_midi_events(self):
+        return iter(self.events)
+
+
+class MockPorts:
+    def __init__(self, port):
+        self.port = port
+
+    def register(self, name: str):
+        return self.port
+
+
+class MockClient:
+    samplerate = 1000
+
+    def __init__(self, *, outport=None, inport=None):
+        self.last_frame_time = 0
+        self.midi_outports = MockPorts(outport)
+        self.midi_inports = MockPorts(inport)
+
+
+@unittest.skipUnless(HAVE_JACK, "JACK not available")
+class TestMidiPlayer(unittest.TestCase):
+    def setUp(self):
+        self.outport = MockOutPort()
+        self.player = MidiPlayer(hub=MockHub())
+        self.player.set_jack_client(MockClient(outport=self.outport))
+
+    def process(self, frames: int) -> list[tuple[int, bytes]]:
+        self.player.jack_process(frames)
+        return self.outport.events
+
+    def test_schedule(self):
+        # Delays are 0, 50, 150, 150 frames at 1000Hz
+        self.player.play("note_on", note=60)
+        self.player.play("note_on", note=62, delay_sec=0.15)
+        self.player.play("note_off", note=60, delay_sec=0.05)
+        self.player.play("note_off", note=62, delay_sec=0.15)
+
+        self.assertEqual(self.process(100), [
+            (0, bytes((0x90, 60, 64))),
+            (50, bytes((0x80, 60, 64))),
+        ])
+        # Events on the same frame are played in the order they were enqueued
+        self.assertEqual(self.process(100), [
+            (50, bytes((0x90, 62, 64))),
+            (50, bytes((0x80, 62, 64))),
+        ])
+        self.assertEqual(self.process(100), [])
+
+    def test_delay_relative_to_current_period(self):
+        self.assertEqual(self.process(100), [])
+        self.player.play_batch([(0.01, bytes((0xC0, 5)))])
+        self.assertEqual(self.process(100), [(10, bytes((0xC0, 5)))])
+
+    def test_port_full(self):
+        self.player.play_batch([(0.0, bytes((0xC0, i))) for i in range(20)])
+        self.assertEqual(self.process(100), [(0, bytes((0xC0, i))) for i in range(16)])
+        # Events that did not fit are dropped
+        self.assertEqual(self.process(100), [])
+
+
+@unittest.skipUnless(HAVE_JACK, "JACK not available")
+class TestMidiReceiver(unittest.TestCase):
+    def setUp(self):
+        self.inport = MockInPort()
+        self.client = MockClient(inport=self.inport)
+        self.receiver = MidiReceiver(hub=MockHub())
+        self.receiver.set_jack_client(self.client)
+
+    def process(self, frame_time: int, events: list[tuple[int, bytes]]) -> None:
+        self.client.last_frame_time = frame_time
+        self.inport.events = events
+        self.receiver.jack_process(100)
+
+    def test_receive(self):
+        self.process(0, [(3, bytes((0x90, 60, 64))), (7, bytes((0xC0, 5)))])
+        self.process(100, [])
+        self.process(200, [(1, bytes((0x80, 60, 0)))])
+
+        msgs = list(self.receiver.read_events())
+        self.assertEqual([(msg.type, msg.time) for msg in msgs], [
+            ("note_on", 3), ("program_change", 7), ("note_off", 201)])
+        self.assertEqual([msg.bytes() for msg in msgs], [[0x90, 60, 64], [0xC0, 5], [0x80, 60, 0]])
+        self.assertEqual(list(self.receiver.read_events()), [])
+
+    def test_partial_record(self):
+        self.process(0, [(3, bytes((0x90, 60, 64)))])
+        # Simulate a record that is only partially readable, as happens when
+        # a write wraps around the end of the ring buffer
+        data = bytes(self.receiver.ring.read(self.receiver.ring.read_space))
+        self.receiver.ring.write(data[:-1])
+        self.assertEqual(list(self.receiver.read_events()), [])
+        self.receiver.ring.write(data[-1:])
+        self.assertEqual([msg.bytes() for msg in self.receiver.read_events()], [[0x90, 60, 64]])
+
+    def test_malformed(self):
+        # A data byte without a status byte cannot be decoded
+        self.process(0, [(3, bytes((0x90, 60, 64))), (5, bytes((60,))), (7, bytes((0xC0, 5)))])
+        msgs = list(self.receiver.read_events())
+        self.assertEqual([(msg.type, msg.time) for msg in msgs], [("note_on", 3), ("program_change", 7)])
+        self.assertEqual(self.receiver.ring.read_space, 0)
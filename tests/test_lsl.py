@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import queue
+import time
+import unittest
+
+import numpy
+
+try:
+    import pylsl
+    HAVE_PYLSL = True
+except ModuleNotFoundError:
+    HAVE_PYLSL = False
+
+if HAVE_PYLSL:
+    from pyeep.lsl import LSLComponent, LSLSamples
+
+
+class MockHub:
+    # LSLComponent only posts samples while the hub loop is running
+    loop = True
+
+    def __init__(self):
+        self.posted: queue.SimpleQueue = queue.SimpleQueue()
+
+    def _running_in_hub(self):
+        return True
+
+    def post_rt(self, f, *args):
+        self.posted.put(args)
+
+
+@unittest.skipUnless(HAVE_PYLSL, "pylsl not available")
+class TestLSLComponent(unittest.TestCase):
+    def pull(self, channel_format: int, values: list[list]) -> list[LSLSamples]:
+        """
+        Stream values through an LSL outlet to a LSLComponent, returning the
+        messages it posted
+        """
+        stream_type = f"pyeep-test-{channel_format}-{time.monotonic_ns()}"
+        info = pylsl.StreamInfo("pyeep-test", stream_type, len(values[0]), 100, channel_format, stream_type)
+        outlet = pylsl.StreamOutlet(info)
+        hub = MockHub()
+        component = LSLComponent(hub=hub, stream_type=stream_type)
+        try:
+            self.assertTrue(outlet.wait_for_consumers(10))
+            for sample in values:
+                outlet.push_sample(sample)
+
+            res: list[LSLSamples] = []
+            count = 0
+            while count < len(values):
+                msg, = hub.posted.get(timeout=10)
+                self.assertEqual(len(msg.samples), len(msg.timestamps))
+                res.append(msg)
+                count += len(msg.samples)
+            return res
+        finally:
+            component.cleanup()
+
+    def test_numeric(self):
+        values = [[i, i * 2] for i in range(10)]
+        msgs = self.pull(pylsl.cf_float32, values)
+        for msg in msgs:
+            self.assertIsInstance(msg.samples, numpy.ndarray)
+            self.assertEqual(msg.samples.dtype, numpy.float32)
+        self.assertEqual(numpy.concatenate([msg.samples for msg in msgs]).tolist(), values)
+
+    def test_string(self):
+        values = [[str(i)] for i in range(10)]
+        msgs = self.pull(pylsl.cf_string, values)
+        self.assertEqual([sample for msg in msgs for sample in msg.samples], values)
@@ -42,6 +42,39 @@ class TestMessage(MessageMixin, unittest.TestCase):
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
 
+    def test_registry(self):
+        class Local(Message):
+            pass
+
+        # Classes are found in the registry, even if they cannot be imported
+        self.assertIs(Jsonable.jsonable_class(Local().as_jsonable()), Local)
+
+    def test_default_name(self):
+        class Local(Message):
+            default_name = "custom"
+
+        class Derived(Local):
+            pass
+
+        self.assertEqual(Local().name, "custom")
+        self.assertEqual(Derived().name, "derived")
+        self.assertEqual(Local(name="other").name, "other")
+
+    def test_generated_as_jsonable(self):
+        class Local(Shortcut):
+            pass
+
+        m = Local(command="test")
+        self.assertEqual(m.as_jsonable(), {
+            "__module__": __name__, "__class__": "Local",
+            "ts": m.ts, "src": None, "dst": None, "name": "local", "command": "test"})
+
+    def test_slots(self):
+        m = Message()
+        self.assertFalse(hasattr(m, "__dict__"))
+        with self.assertRaises(AttributeError):
+            m.foo = 1
+
 
 class TestComponent(MessageMixin, unittest.TestCase):
     def test_shutdown(self):
@@ -55,6 +88,7 @@ class TestComponent(MessageMixin, unittest.TestCase):
         self.assertEqual(m1.name, "shutdown")
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
+        self.assertFalse(hasattr(m1, "__dict__"))
 
     def test_newcomponent(self):
         m = NewComponent()
@@ -67,6 +101,7 @@ class TestComponent(MessageMixin, unittest.TestCase):
         self.assertEqual(m1.name, "newcomponent")
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
+        self.assertFalse(hasattr(m1, "__dict__"))
 
     def test_componentactivestatechanged(self):
         m = ComponentActiveStateChanged(value=True)
@@ -81,6 +116,7 @@ class TestComponent(MessageMixin, unittest.TestCase):
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
         self.assertTrue(m1.value)
+        self.assertFalse(hasattr(m1, "__dict__"))
 
     def test_devicescanrequest(self):
         m = DeviceScanRequest(duration=3.14)
@@ -95,6 +131,7 @@ class TestComponent(MessageMixin, unittest.TestCase):
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
         self.assertEqual(m1.duration, 3.14)
+        self.assertFalse(hasattr(m1, "__dict__"))
 
 
 class TestConfig(MessageMixin, unittest.TestCase):
@@ -109,6 +146,7 @@ class TestConfig(MessageMixin, unittest.TestCase):
         self.assertEqual(m1.name, "configsaverequest")
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
+        self.assertFalse(hasattr(m1, "__dict__"))
 
     def test_configure(self):
         m = Configure(config={"test": "val"})
@@ -123,6 +161,7 @@ class TestConfig(MessageMixin, unittest.TestCase):
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
         self.assertEqual(m1.config, {"test": "val"})
+        self.assertFalse(hasattr(m1, "__dict__"))
 
 
 class TestInput(MessageMixin, unittest.TestCase):
@@ -145,12 +184,15 @@ class TestInput(MessageMixin, unittest.TestCase):
         self.assertIsNone(m.src)
         self.assertIsNone(m.dst)
         self.assertEqual(m.command, "test")
+        self.assertEqual(str(m), "shortcut(command=test)")
+        self.assertEqual(str(Shortcut(command="test", name="custom")), "custom(command=test)")
 
         m1 = self.assertSerializes(m)
         self.assertEqual(m1.name, "shortcut")
         self.assertIsNone(m1.src)
         self.assertIsNone(m1.dst)
         self.assertEqual(m1.command, "test")
+        self.assertFalse(hasattr(m1, "__dict__"))
 
     def test_pause(self):
         m = Pause(group=3)
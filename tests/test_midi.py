@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import struct
+import unittest
+from typing import Iterator
+
+import mido
+
+from pyeep.midi import encode_message, frame_delay, read_ring_records
+
+
+class TestEncode(unittest.TestCase):
+    def test_encode(self):
+        for type, args in (
+                ("note_on", {"note": 60}),
+                ("note_on", {"channel": 15, "note": 127, "velocity": 127}),
+                ("note_off", {"note": 60, "velocity": 0, "time": 3}),
+                ("polytouch", {"channel": 2, "note": 3, "value": 5}),
+                ("control_change", {"channel": 2, "control": 7, "value": 100}),
+                ("program_change", {"channel": 9, "program": 5}),
+                ("aftertouch", {"channel": 4, "value": 3}),
+                ("pitchwheel", {"pitch": -8192}),
+                ("pitchwheel", {"channel": 1, "pitch": 8191}),
+                ("sysex", {"data": [1, 2]})):
+            with self.subTest(type=type, args=args):
+                data = encode_message(type, **args)
+                # The mido fallback, used for sysex, gives a bytearray
+                self.assertIsInstance(data, bytes)
+                self.assertEqual(data, bytes(mido.Message(type, **args).bin()))
+
+    def test_invalid(self):
+        for type, args in (
+                ("note_on", {"channel": 16, "note": 60}),
+                ("note_on", {"channel": -1, "note": 60}),
+                ("note_on", {"note": 128}),
+                ("note_off", {"note": 60, "velocity": 300}),
+                ("control_change", {"control": -1}),
+                ("program_change", {"program": 128}),
+                ("pitchwheel", {"pitch": 8192}),
+                ("pitchwheel", {"pitch": -8193}),
+                ("note_on", {"note": 60, "velocty": 10}),
+                ("aftertouch", {"note": 60})):
+            with self.subTest(type=type, args=args):
+                with self.assertRaises(ValueError):
+                    encode_message(type, **args)
+
+        with self.assertRaises(TypeError):
+            encode_message("note_on", note=60.0)
+
+
+class TestFrameDelay(unittest.TestCase):
+    def test_frame_delay(self):
+        self.assertEqual(frame_delay(0.0, 48000), 0)
+        self.assertEqual(frame_delay(0.5, 48000), 24000)
+        self.assertEqual(frame_delay(1 / 96000, 48000), 1)
+        self.assertEqual(frame_delay(0.4 / 48000, 48000), 0)
+        # Late events are played immediately
+        self.assertEqual(frame_delay(-0.1, 48000), 0)
+
+
+class Ring:
+    """
+    Model of jack.RingBuffer where, like in jack_ringbuffer_write, a write
+    that wraps around the end of the buffer becomes readable in two steps
+    """
+    def __init__(self, size: int):
+        self.buf = bytearray(size)
+        self.read_ptr = 0
+        self.write_ptr = 0
+
+    @property
+    def read_space(self) -> int:
+        return (self.write_ptr - self.read_ptr) % len(self.buf)
+
+    def write_steps(self, data: bytes) -> Iterator[None]:
+        """
+        Write data, yielding after each step that makes part of it readable
+        """
+        first = min(len(data), len(self.buf) - self.write_ptr)
+        self.buf[self.write_ptr:self.write_ptr + first] = data[:first]
+        self.write_ptr = (self.write_ptr + first) % len(self.buf)
+        yield
+        if (rest := len(data) - first):
+            self.buf[:rest] = data[first:]
+            self.write_ptr = rest
+            yield
+
+    def peek(self, size: int) -> bytes:
+        size = min(size, self.read_space)
+        return bytes(self.buf[(self.read_ptr + i) % len(self.buf)] for i in range(size))
+
+    def read_advance(self, size: int) -> None:
+        self.read_ptr = (self.read_ptr + size) % len(self.buf)
+
+    def read(self, size: int) -> bytes:
+        data = self.peek(size)
+        self.read_advance(len(data))
+        return data
+
+
+class TestReadRingRecords(unittest.TestCase):
+    def test_wrap(self):
+        header = struct.Struct("<IH")
+        ring = Ring(32)
+        records = [(i, bytes(range(i % 7 + 1))) for i in range(50)]
+        res: list[tuple[int, bytes]] = []
+        wrapped = 0
+        for time, data in records:
+            steps = 0
+            for step in ring.write_steps(header.pack(time, len(data)) + data):
+                steps += 1
+                res.extend(read_ring_records(ring, header))
+            if steps > 1:
+                wrapped += 1
+        # Make sure that the test exercised partially readable records
+        self.assertGreater(wrapped, 10)
+        self.assertEqual(res, records)
+        self.assertEqual(ring.read_space, 0)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import math
 import unittest
 
-from pyeep.midisynth import Envelope, EnvelopeShape
+import mido
+import numpy
+
+from pyeep.midisynth import AudioConfig, Envelope, EnvelopeShape, Instrument, Sine
 
 
 class TestEnvelope(unittest.TestCase):
@@ -87,3 +91,18 @@ class TestEnvelope(unittest.TestCase):
             0.08333333333333337, 0.0, 0.0, 0.0])
 
         self.assertIsNone(e.generate(15, 10))
+
+
+class TestNote(unittest.TestCase):
+    def test_freq(self):
+        instrument = Instrument(
+                AudioConfig(in_samplerate=48000, out_samplerate=48000, dtype=numpy.float32),
+                channel=0, note_cls=Sine, envelope=EnvelopeShape())
+        note = Sine(instrument=instrument, note=69, envelope=instrument.envelope)
+        self.assertEqual(note.get_freq(), 440.0)
+
+        note._update_note_state(mido.Message("pitchwheel", pitch=4096))
+        self.assertEqual(note.get_freq(), 440.0 * math.exp2(1 / 12))
+
+        note._update_note_state(mido.Message("pitchwheel", pitch=0))
+        self.assertEqual(note.get_freq(), 440.0)
@@ -55,12 +55,12 @@ class TestSubprocess(unittest.IsolatedAsyncioTestCase):
         outfile = self.workdir / "output"
 
         scriptfile = self.workdir / "script"
-        scriptfile.write_text(f"#!/bin/sh\nnc -U $1 > {outfile}")
+        scriptfile.write_text(f"#!/bin/bash\ncat <&$PYEEP_SOCKET_FD > {outfile}")
         scriptfile.chmod(0o755)
 
         class Comp(TopComponent):
             def get_commandline(self):
-                return [scriptfile, self.workdir / "socket"]
+                return [scriptfile]
 
         comp = Comp(hub=MockHub())
         comp_task = asyncio.create_task(comp.run())
@@ -102,12 +102,12 @@ class TestSubprocess(unittest.IsolatedAsyncioTestCase):
         outfile = self.workdir / "output"
 
         scriptfile = self.workdir / "script"
-        scriptfile.write_text(f"#!/bin/sh\necho {encoded} | nc -U $1 > {outfile}")
+        scriptfile.write_text(f"#!/bin/bash\necho {encoded} >&$PYEEP_SOCKET_FD\ncat <&$PYEEP_SOCKET_FD > {outfile}")
         scriptfile.chmod(0o755)
 
         class Comp(TopComponent):
             def get_commandline(self):
-                return [scriptfile, self.workdir / "socket"]
+                return [scriptfile]
 
             async def process_remote_message(self, msg: Message):
                 self.send(msg)